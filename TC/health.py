@@ -0,0 +1,103 @@
+"""
+Sondes pour le load balancer.
+
+- /healthz : le processus répond (aucune dépendance consultée).
+- /readyz  : base de données, cache, serveur SMTP et templates préchauffés, avec la
+  latence de chaque dépendance. Les résultats sont gardés HEALTH_PROBE_TTL secondes
+  dans le processus pour que les sondes n'ajoutent pas de charge.
+"""
+import socket
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.http import JsonResponse
+from django.views.decorators.cache import never_cache
+from django.views.decorators.http import require_GET
+
+from . import warmup
+
+
+def check_database():
+    for alias in connections:
+        with connections[alias].cursor() as cursor:
+            cursor.execute('SELECT 1')
+
+
+def check_cache():
+    key = f'readyz:{uuid.uuid4().hex}'
+    cache.set(key, 1, 5)
+    if cache.get(key) != 1:
+        raise RuntimeError("lecture du cache incohérente")
+    cache.delete(key)
+
+
+def check_smtp():
+    # Simple ouverture TCP : on ne dialogue pas avec le serveur
+    with socket.create_connection((settings.EMAIL_HOST, settings.EMAIL_PORT), timeout=settings.HEALTH_SMTP_TIMEOUT):
+        pass
+
+
+def check_templates():
+    if not warmup.is_prepared():
+        warmup.prepare()  # Premier passage : on préchauffe au lieu d'échouer
+
+
+# (nom, fonction, critique) : une dépendance non critique dégrade l'état sans rendre le worker indisponible
+PROBES = [
+    ('database', check_database, True),
+    ('cache', check_cache, True),
+    ('smtp', check_smtp, False),
+    ('templates', check_templates, True),
+]
+
+_results = {}
+_lock = threading.Lock()
+
+
+def run_probe(name, func):
+    cached = _results.get(name)
+    now = time.monotonic()
+    if cached is not None and now - cached['checked_at'] < settings.HEALTH_PROBE_TTL:
+        return cached
+    with _lock:
+        cached = _results.get(name)
+        if cached is not None and now - cached['checked_at'] < settings.HEALTH_PROBE_TTL:
+            return cached
+        start = time.perf_counter()
+        try:
+            func()
+            result = {'ok': True}
+        except Exception as exc:
+            result = {'ok': False, 'error': f"{type(exc).__name__}: {exc}"}
+        result['latency_ms'] = round((time.perf_counter() - start) * 1000, 2)
+        result['checked_at'] = time.monotonic()
+        _results[name] = result
+        return result
+
+
+@never_cache
+@require_GET
+def healthz(request):
+    return JsonResponse({'status': 'ok'})
+
+
+@never_cache
+@require_GET
+def readyz(request):
+    checks = {}
+    ready, degraded = True, False
+    for name, func, critical in PROBES:
+        result = run_probe(name, func)
+        checks[name] = {key: value for key, value in result.items() if key != 'checked_at'}
+        checks[name]['age_s'] = round(time.monotonic() - result['checked_at'], 1)
+        if not result['ok']:
+            if critical:
+                ready = False
+            else:
+                degraded = True
+    status = 'ok' if ready and not degraded else ('degraded' if ready else 'unavailable')
+    return JsonResponse({'status': status, 'checks': checks}, status=200 if ready else 503)
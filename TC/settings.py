@@ -12,7 +12,7 @@ https://docs.djangoproject.com/en/4.2/ref/settings/
 
 from pathlib import Path
 import os
-from decouple import config
+from decouple import config, Csv
 import dj_database_url
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -28,7 +28,7 @@ TEMPLATES_DIR = os.path.join(BASE_DIR, 'templates')
 # SECRET_KEY = config('SECRET_KEY')
 
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = config('DEBUG')
+# DEBUG = config('DEBUG')  # lu une seule fois plus bas, avec une valeur par défaut
 
 # ALLOWED_HOSTS = []
 
@@ -54,18 +54,33 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [    
     'django.middleware.security.SecurityMiddleware',
+    # Profilage par échantillonnage, retiré de la chaîne si PROFILER_ENABLED est faux
+    'utilisateur.profiling.SamplingProfilerMiddleware',
     # Pour servir les fichiers statiques en production
     'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    # Base de la région de l'utilisateur connecté pour les requêtes de la vue
+    'utilisateur.sharding.RegionMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
+    # Journal d'audit : écrit en une fois à la fin de la requête
+    'utilisateur.audit.AuditMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
 ROOT_URLCONF = 'TC.urls'
-STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+# STATICFILES_STORAGE n'est plus lu depuis Django 5.1 : on passe par STORAGES
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        # Noms avec empreinte (hash) + variantes .gz et .br générées au collectstatic
+        'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage',
+    },
+}
 
 TEMPLATES = [
     {
@@ -110,6 +125,19 @@ else:
             'PORT': config('DB_PORT', default='5432'),
         }
     }
+
+# Partitionnement par région (utilisateur/sharding.py) : patients, médecins et consultations
+# sont stockés dans la base de leur région ; utilisateurs, sessions et audit restent sur "default".
+# DATABASE_SHARDS="eu=postgres://...,af=postgres://..." (en local : "eu=sqlite:///eu.sqlite3,...").
+# L'ordre est figé : la position d'une région fixe la plage d'identifiants de ses consultations.
+SHARDS = {}
+for entry in config('DATABASE_SHARDS', default='', cast=Csv()):
+    region, url = (part.strip() for part in entry.split('=', 1))
+    SHARDS[region] = f'shard_{region}'
+    DATABASES[SHARDS[region]] = dj_database_url.parse(url, conn_max_age=600)
+DEFAULT_REGION = config('DEFAULT_REGION', default=next(iter(SHARDS), ''))
+DATABASE_ROUTERS = ['utilisateur.sharding.RegionRouter']
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -149,6 +177,31 @@ STATICFILES_DIRS = [
     os.path.join(BASE_DIR, 'static/')
 ]
 STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
+STATICFILES_FINDERS = [
+    # Ne collecte que les fichiers référencés par les templates (voir utilisateur/assets.py)
+    'utilisateur.finders.ReferencedFileSystemFinder',
+    'django.contrib.staticfiles.finders.AppDirectoriesFinder',
+]
+STATIC_PRUNE_UNUSED = config('STATIC_PRUNE_UNUSED', default=True, cast=bool)
+# Bundles générés par `python manage.py build_static_bundle`
+STATIC_BUNDLES = {
+    'assets/dist/app.min.css': [
+        'assets/libs/owl.carousel/dist/assets/owl.carousel.min.css',
+        'assets/libs/aos-master/dist/aos.css',
+        'assets/css/styles.css',
+    ],
+    'assets/dist/app.min.js': [
+        'assets/libs/jquery/dist/jquery.min.js',
+        'assets/libs/bootstrap/dist/js/bootstrap.bundle.min.js',
+        'assets/libs/owl.carousel/dist/owl.carousel.min.js',
+        'assets/libs/aos-master/dist/aos.js',
+        'assets/js/custom.js',
+    ],
+}
+# Les fichiers avec empreinte sont servis avec "Cache-Control: immutable" ;
+# on ne garde pas les copies sans empreinte dans STATIC_ROOT.
+WHITENOISE_KEEP_ONLY_HASHED_FILES = True
+WHITENOISE_MAX_AGE = 3600 if not DEBUG else 0
 
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media/')
@@ -157,6 +210,77 @@ MEDIA_ROOT = os.path.join(BASE_DIR, 'media/')
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# REDIS_URL partagé entre les workers si disponible, sinon cache mémoire local au processus
+REDIS_URL = config('REDIS_URL', default=None)
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'tconsult-default',
+        }
+    }
+
+# Sessions et messages
+# https://docs.djangoproject.com/en/5.2/topics/http/sessions/#configuring-the-session-engine
+# cached_db : lecture depuis le cache, écriture en base (write-through) pour survivre à un redémarrage.
+# Seulement avec un cache partagé (Redis) : avec LocMemCache, chaque worker garderait sa
+# copie de la session (déconnexion ou changement invisibles pour les autres workers).
+# signed_cookies : aucune requête en base, adapté tant que la session reste petite.
+SESSION_ENGINE = config(
+    'SESSION_ENGINE',
+    default='django.contrib.sessions.backends.cached_db' if REDIS_URL else 'django.contrib.sessions.backends.db',
+)
+SESSION_SAVE_EVERY_REQUEST = False
+# Les messages flash voyagent dans un cookie signé : pas d'écriture de session à chaque redirection
+MESSAGE_STORAGE = config('MESSAGE_STORAGE', default='django.contrib.messages.storage.cookie.CookieStorage')
+# Taille des lots pour la commande purge_expired_sessions
+SESSION_PURGE_BATCH_SIZE = config('SESSION_PURGE_BATCH_SIZE', default=1000, cast=int)
+
+# Archivage des consultations terminées et payées (commande archive_consultations)
+CONSULTATION_ARCHIVE_AFTER_DAYS = config('CONSULTATION_ARCHIVE_AFTER_DAYS', default=180, cast=int)
+
+# Salles de visioconférence (utilisateur/rooms.py)
+VIDEO_ROOM_PROVIDER = config('VIDEO_ROOM_PROVIDER', default='utilisateur.rooms.JitsiProvider')
+VIDEO_ROOM_POOL_SIZE = config('VIDEO_ROOM_POOL_SIZE', default=100, cast=int)
+VIDEO_JOIN_TOKEN_MAX_AGE = config('VIDEO_JOIN_TOKEN_MAX_AGE', default=4 * 3600, cast=int)  # secondes
+
+# Profilage des requêtes (utilisateur/profiling.py)
+PROFILER_ENABLED = config('PROFILER_ENABLED', default=False, cast=bool)
+PROFILER_SAMPLE_RATE = config('PROFILER_SAMPLE_RATE', default=0.01, cast=float)  # 1 % des requêtes
+PROFILER_INTERVAL = config('PROFILER_INTERVAL', default=0.005, cast=float)  # secondes entre deux relevés
+PROFILER_OUTPUT_DIR = config('PROFILER_OUTPUT_DIR', default=os.path.join(BASE_DIR, 'profiles'))
+PROFILER_TOKEN_MAX_AGE = config('PROFILER_TOKEN_MAX_AGE', default=3600, cast=int)
+PROFILER_SLOW_SQL = config('PROFILER_SLOW_SQL', default=20, cast=int)
+
+# Sondes /healthz et /readyz (TC/health.py)
+HEALTH_PROBE_TTL = config('HEALTH_PROBE_TTL', default=5, cast=float)  # secondes
+HEALTH_SMTP_TIMEOUT = config('HEALTH_SMTP_TIMEOUT', default=1, cast=float)
+
+# Salle d'attente des consultations sans rendez-vous (utilisateur/waiting_room.py)
+WAITING_ROOM_SERVICE_MINUTES = config('WAITING_ROOM_SERVICE_MINUTES', default=15, cast=int)  # Durée estimée avant mesures
+WAITING_ROOM_RESYNC = config('WAITING_ROOM_RESYNC', default=30, cast=int)  # Secondes entre deux relectures complètes de la file
+WAITING_ROOM_SYNC_INTERVAL = config('WAITING_ROOM_SYNC_INTERVAL', default=1, cast=float)  # Secondes entre deux lectures des ajouts
+WAITING_ROOM_SYNC_OVERLAP = config('WAITING_ROOM_SYNC_OVERLAP', default=10, cast=int)  # Secondes relues en double (commits tardifs)
+
+# Limitation de débit (utilisateur/ratelimit.py) : (nombre de requêtes, fenêtre en secondes)
+RATELIMIT_ENABLED = config('RATELIMIT_ENABLED', default=True, cast=bool)
+# Nombre de proxys (nginx, répartiteur...) devant gunicorn qui ajoutent leur entrée à X-Forwarded-For ; 0 : REMOTE_ADDR
+RATELIMIT_TRUSTED_PROXIES = config('RATELIMIT_TRUSTED_PROXIES', default=0 if DEBUG else 1, cast=int)
+RATELIMITS = {
+    'login': (config('RATELIMIT_LOGIN', default=10, cast=int), 60),
+    'register': (config('RATELIMIT_REGISTER', default=5, cast=int), 3600),
+}
+
 if DEBUG:
     EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
     EMAIL_HOST = 'localhost'
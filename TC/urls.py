@@ -20,11 +20,15 @@ from django.conf import settings
 from django.conf.urls.static import static
 from utilisateur.views import CustomLoginView
 from django.contrib.staticfiles.urls import staticfiles_urlpatterns
+from TC.health import healthz, readyz
 
 urlpatterns = [
     path('', CustomLoginView.as_view(), name='home'),  # Page d'accueil redirigée vers login
     path('admin/', admin.site.urls),
     path('accounts/',include('utilisateur.urls')),
+    # Sondes du load balancer
+    path('healthz', healthz, name='healthz'),
+    path('readyz', readyz, name='readyz'),
 ]
 if settings.DEBUG:
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
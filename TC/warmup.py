@@ -0,0 +1,72 @@
+"""
+Préchauffage du processus avant la première requête.
+
+- prepare() : construit le résolveur d'URL et compile tous les templates (cache du
+  loader). Appelé dans le processus maître de gunicorn (preload_app), le travail
+  est partagé par tous les workers après le fork.
+- connect_databases() : ouvre les connexions DB. À appeler dans chaque worker,
+  jamais avant le fork (une connexion ne se partage pas entre processus).
+"""
+import os
+import time
+
+from django.db import connections
+from django.template import engines
+from django.template.exceptions import TemplateDoesNotExist, TemplateSyntaxError
+from django.urls import get_resolver
+
+
+def warm_urls():
+    resolver = get_resolver()
+    # Force le remplissage des tables de reverse() et de résolution
+    resolver.reverse_dict
+    resolver.app_dict
+    return len(resolver.url_patterns)
+
+
+def warm_templates():
+    count = 0
+    for engine in engines.all():
+        for root in getattr(engine, 'template_dirs', []):
+            for dirpath, _, filenames in os.walk(root):
+                for filename in filenames:
+                    if not filename.endswith(('.html', '.txt')):
+                        continue
+                    name = os.path.relpath(os.path.join(dirpath, filename), root).replace(os.sep, '/')
+                    try:
+                        engine.get_template(name)
+                        count += 1
+                    except (TemplateDoesNotExist, TemplateSyntaxError):
+                        pass
+    return count
+
+
+_prepared = False
+
+
+def is_prepared():
+    return _prepared
+
+
+def prepare():
+    """Retourne les durées (secondes) de chaque étape."""
+    global _prepared
+    timings = {}
+    start = time.perf_counter()
+    warm_urls()
+    timings['urls'] = time.perf_counter() - start
+    start = time.perf_counter()
+    warm_templates()
+    timings['templates'] = time.perf_counter() - start
+    _prepared = True
+    return timings
+
+
+def close_databases():
+    for conn in connections.all(initialized_only=True):
+        conn.close()
+
+
+def connect_databases():
+    for alias in connections:
+        connections[alias].ensure_connection()
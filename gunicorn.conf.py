@@ -0,0 +1,26 @@
+# Configuration gunicorn (lue automatiquement depuis la racine du projet)
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+workers = int(os.environ.get('WEB_CONCURRENCY', '2'))
+# Importe Django, les URL et les templates une seule fois dans le maître, avant le fork
+preload_app = os.environ.get('GUNICORN_PRELOAD', '1') == '1'
+
+
+def when_ready(server):
+    if preload_app:
+        from TC.warmup import prepare, close_databases
+        timings = prepare()
+        # Aucune connexion DB ne doit être héritée par les workers
+        close_databases()
+        server.log.info("Préchauffage : " + ", ".join(f"{k} {v * 1000:.0f} ms" for k, v in timings.items()))
+
+
+def post_worker_init(worker):
+    from TC.warmup import prepare, connect_databases
+    if not preload_app:
+        prepare()
+    try:
+        connect_databases()
+    except Exception as exc:  # La base n'est pas encore joignable : connexion à la première requête
+        worker.log.warning(f"Connexion DB différée : {exc}")
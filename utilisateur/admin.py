@@ -1,11 +1,106 @@
+from contextlib import nullcontext
+
+from django.conf import settings
 from django.contrib import admin
 from .models import *
+from .sharding import shard_for_consultation_id, shard_for_region, use_shard
+from .waiting_room import get_waiting_room
 
-admin.site.register(User)
-admin.site.register(Patient)
-admin.site.register(Doctor)
-admin.site.register(Consultation)
+
+# Données régionales (utilisateur/sharding.py) : la liste se filtre par région,
+# la fiche d'un objet s'ouvre dans la base déduite de son id.
+class RegionFilter(admin.SimpleListFilter):
+    title = 'région'
+    parameter_name = 'region'
+
+    def lookups(self, request, model_admin):
+        return [(region, region) for region in settings.SHARDS]
+
+    def queryset(self, request, queryset):
+        if self.value() in settings.SHARDS:
+            return queryset.using(settings.SHARDS[self.value()])
+        return queryset
+
+
+class RegionalAdmin(admin.ModelAdmin):
+    def object_shard(self, object_id):
+        return shard_for_consultation_id(object_id)
+
+    def _object_context(self, object_id):
+        if not settings.SHARDS or not object_id:
+            return nullcontext()
+        try:
+            return use_shard(self.object_shard(object_id))
+        except (TypeError, ValueError):
+            return nullcontext()
+
+    def get_list_filter(self, request):
+        list_filter = list(super().get_list_filter(request))
+        return [RegionFilter, *list_filter] if settings.SHARDS else list_filter
+
+    def changeform_view(self, request, object_id=None, form_url='', extra_context=None):
+        with self._object_context(object_id):
+            return super().changeform_view(request, object_id, form_url, extra_context)
+
+    def delete_view(self, request, object_id, extra_context=None):
+        with self._object_context(object_id):
+            return super().delete_view(request, object_id, extra_context)
+
+    def history_view(self, request, object_id, extra_context=None):
+        with self._object_context(object_id):
+            return super().history_view(request, object_id, extra_context)
 
 
+class ProfileAdmin(RegionalAdmin):
+    # Patient et Doctor ont l'id du User : sa région donne la base
+    def object_shard(self, object_id):
+        return shard_for_region(User.objects.filter(pk=object_id).values_list('region', flat=True).first())
 
 
+class WaitingRoomEntryAdmin(RegionalAdmin):
+    # Seul le personnel fixe l'urgence : le patient entre toujours en priorité normale
+    list_display = ('id', 'patient', 'specialty', 'priority', 'status', 'enqueued_at')
+    list_filter = ('status', 'priority')
+    readonly_fields = ('priority',)  # Modifiée par les actions : la file en mémoire suit
+    actions = ['mark_urgent', 'mark_normal']
+
+    def _set_priority(self, request, queryset, priority):
+        room = get_waiting_room(queryset.db)
+        ids = queryset.filter(status='waiting').values_list('pk', flat=True)
+        updated = sum(room.set_priority(entry_id, priority) for entry_id in ids)
+        self.message_user(request, f"{updated} entrée(s) mise(s) à jour.")
+
+    @admin.action(description="Marquer comme urgent")
+    def mark_urgent(self, request, queryset):
+        self._set_priority(request, queryset, 0)
+
+    @admin.action(description="Remettre en priorité normale")
+    def mark_normal(self, request, queryset):
+        self._set_priority(request, queryset, 1)
+
+
+class AuditLogAdmin(admin.ModelAdmin):
+    # Journal en ajout seul : consultable, jamais modifié ni supprimé depuis l'admin
+    list_display = ('created_at', 'model_name', 'object_id', 'field', 'old_value', 'new_value', 'actor')
+    list_filter = ('model_name', 'field')
+
+    def get_readonly_fields(self, request, obj=None):
+        return [field.name for field in self.model._meta.fields]
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
+admin.site.register(User)
+admin.site.register(Patient, ProfileAdmin)
+admin.site.register(Doctor, ProfileAdmin)
+admin.site.register(Consultation, RegionalAdmin)
+admin.site.register(ArchivedConsultation, RegionalAdmin)
+admin.site.register(AuditLog, AuditLogAdmin)
+admin.site.register(WaitingRoomEntry, WaitingRoomEntryAdmin)
@@ -0,0 +1,216 @@
+"""
+API JSON v1 des consultations (client mobile).
+
+- sélection de champs : ?fields=date,status,video_link
+- pagination par curseur (keyset) sur (date, id), du plus récent au plus ancien
+- liste et détail couvrent aussi les consultations archivées (archive.all_consultations)
+- lecture via values() : aucun objet modèle n'est instancié pour les listes
+- réponses compressées en gzip
+"""
+import json
+
+from django.core import signing
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from django.http import JsonResponse
+from django.views.decorators.gzip import gzip_page
+from django.views.decorators.http import require_http_methods
+
+from .archive import all_consultations
+from .forms import ConsultationForm
+from .models import Consultation, STATUS_CHOICES
+from .waiting_room import get_waiting_room
+
+API_VERSION = 'v1'
+
+# Nom public -> chemin ORM
+FIELDS = {
+    'id': 'id',
+    'date': 'date',
+    'status': 'status',
+    'payment_status': 'payment_status',
+    'payment_amount': 'payment_amount',
+    'video_link': 'video_link',
+    'notes': 'notes',
+    'duration': 'duration',
+    'patient': 'patient_name',
+    'doctor': 'doctor_name',
+    'doctor_specialty': 'doctor_specialty',
+    'created_at': 'created_at',
+    'updated_at': 'updated_at',
+}
+DEFAULT_FIELDS = ('id', 'date', 'status', 'video_link', 'doctor', 'patient')
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+
+# Transitions autorisées pour le statut
+TRANSITIONS = {
+    'pending': {'in_progress'},
+    'in_progress': {'completed'},
+    'completed': set(),
+}
+CURSOR_SALT = 'utilisateur.api.cursor'
+
+
+class ApiError(Exception):
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+def api_response(data, status=200):
+    return JsonResponse(
+        data, status=status, encoder=DjangoJSONEncoder, json_dumps_params={'separators': (',', ':')},
+    )
+
+
+def api_view(methods):
+    """Authentification par session, méthodes autorisées, gzip et erreurs en JSON."""
+    def decorator(view_func):
+        @gzip_page
+        @require_http_methods(methods)
+        def _wrapped(request, *args, **kwargs):
+            if not request.user.is_authenticated:
+                return api_response({'error': "Authentification requise."}, status=401)
+            try:
+                return view_func(request, *args, **kwargs)
+            except ApiError as exc:
+                return api_response({'error': str(exc)}, status=exc.status)
+        return _wrapped
+    return decorator
+
+
+def selected_fields(request):
+    raw = request.GET.get('fields')
+    if not raw:
+        return DEFAULT_FIELDS
+    names = tuple(dict.fromkeys(name.strip() for name in raw.split(',') if name.strip()))
+    unknown = [name for name in names if name not in FIELDS]
+    if unknown:
+        raise ApiError(f"Champs inconnus : {', '.join(unknown)}")
+    return names
+
+
+def owner_filter(user):
+    # Patient et Doctor ont pour clé primaire l'id du User : filtre sans jointure
+    if getattr(user, 'is_patient', False):
+        return {'patient_id': user.pk}
+    if getattr(user, 'is_doctor', False):
+        return {'doctor_id': user.pk}
+    return None
+
+
+def visible_consultations(user):
+    filters = owner_filter(user)
+    return Consultation.objects.filter(**filters) if filters is not None else Consultation.objects.none()
+
+
+def history(user, names, *conditions, **filters):
+    """Consultations visibles, archivées comprises (union), en dictionnaires avec date et id."""
+    owner = owner_filter(user)
+    if owner is None:
+        return Consultation.objects.none().values()
+    paths = dict.fromkeys(['date', 'id', *(FIELDS[name] for name in names)])
+    return all_consultations(*conditions, fields=list(paths), **owner, **filters)
+
+
+def public(row, names):
+    return {name: row[FIELDS[name]] for name in names}
+
+
+def serialize(queryset, names):
+    """Lignes values() renommées avec les noms publics."""
+    paths = [FIELDS[name] for name in names]
+    return [dict(zip(names, row)) for row in queryset.values_list(*paths)]
+
+
+def encode_cursor(date, pk):
+    return signing.dumps([date.isoformat(), pk], salt=CURSOR_SALT, compress=True)
+
+
+def decode_cursor(token):
+    try:
+        date, pk = signing.loads(token, salt=CURSOR_SALT)
+    except (signing.BadSignature, ValueError, TypeError):
+        raise ApiError("Curseur invalide.")
+    return date, pk
+
+
+def _limit(request):
+    try:
+        limit = int(request.GET.get('limit', DEFAULT_LIMIT))
+    except ValueError:
+        raise ApiError("Paramètre limit invalide.")
+    return max(1, min(limit, MAX_LIMIT))
+
+
+def _json_body(request):
+    try:
+        data = json.loads(request.body or b'{}')
+    except ValueError:
+        raise ApiError("Corps JSON invalide.")
+    if not isinstance(data, dict):
+        raise ApiError("Corps JSON invalide.")
+    return data
+
+
+@api_view(['GET', 'POST'])
+def consultation_list(request):
+    if request.method == 'POST':
+        return _create_consultation(request)
+
+    names = selected_fields(request)
+    limit = _limit(request)
+    conditions = []
+    cursor = request.GET.get('cursor')
+    if cursor:
+        date, pk = decode_cursor(cursor)
+        # Condition appliquée à chaque table avant l'union : chaque côté utilise son index
+        conditions.append(Q(date__lt=date) | Q(date=date, id__lt=pk))
+
+    # On lit date et id en plus pour construire le curseur suivant
+    rows = list(history(request.user, names, *conditions)[:limit + 1])
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    results = [public(row, names) for row in rows]
+    next_cursor = encode_cursor(rows[-1]['date'], rows[-1]['id']) if has_more else None
+    return api_response({'version': API_VERSION, 'results': results, 'next_cursor': next_cursor})
+
+
+def _create_consultation(request):
+    if not getattr(request.user, 'is_patient', False):
+        raise ApiError("Seul un patient peut créer une consultation.", status=403)
+    form = ConsultationForm(_json_body(request))
+    if not form.is_valid():
+        return api_response({'errors': form.errors.get_json_data()}, status=400)
+    form.instance.patient = request.user.patient
+    consultation = form.save()
+    data = serialize(Consultation.objects.filter(pk=consultation.pk), selected_fields(request))[0]
+    return api_response({'version': API_VERSION, 'result': data}, status=201)
+
+
+@api_view(['GET'])
+def consultation_detail(request, consultation_id):
+    names = selected_fields(request)
+    rows = list(history(request.user, names, id=consultation_id)[:1])
+    if not rows:
+        raise ApiError("Consultation introuvable.", status=404)
+    return api_response({'version': API_VERSION, 'result': public(rows[0], names)})
+
+
+@api_view(['POST'])
+def consultation_status(request, consultation_id):
+    status = _json_body(request).get('status')
+    if not isinstance(status, str) or status not in dict(STATUS_CHOICES):
+        raise ApiError("Statut invalide.")
+    consultation = visible_consultations(request.user).filter(pk=consultation_id).first()
+    if consultation is None:
+        raise ApiError("Consultation introuvable.", status=404)
+    if status not in TRANSITIONS[consultation.status]:
+        raise ApiError(f"Transition {consultation.status} -> {status} non autorisée.", status=409)
+    consultation.status = status
+    consultation.save(update_fields=['status', 'updated_at'])
+    if status == 'completed' and request.user.pk == consultation.doctor_id:
+        get_waiting_room().consultation_completed(consultation)  # Patient suivant de la salle d'attente
+    data = serialize(Consultation.objects.filter(pk=consultation.pk), selected_fields(request))[0]
+    return api_response({'version': API_VERSION, 'result': data})
@@ -1,6 +1,14 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class UtilisateurConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'utilisateur'
+
+    def ready(self):
+        # Enregistre les signaux du journal d'audit et des champs dénormalisés
+        from . import audit, signals  # noqa: F401
+        from .sharding import reserve_id_range
+        # Plage d'ids des consultations de chaque base régionale
+        post_migrate.connect(reserve_id_range, sender=self, dispatch_uid='reserve_id_range')
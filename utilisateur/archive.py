@@ -0,0 +1,77 @@
+"""
+Archivage des consultations terminées et payées.
+
+La table Consultation ne garde que les données récentes (lues par les tableaux de
+bord à chaque requête) ; l'historique complet se lit avec all_consultations(),
+qui fusionne table chaude et archive. Chaque base régionale est archivée à son tour.
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import router, transaction
+from django.utils import timezone
+
+from .models import Consultation, ArchivedConsultation
+from .sharding import shard_aliases
+
+ARCHIVED_FIELDS = [
+    'id', 'patient_id', 'doctor_id', 'date', 'created_at', 'updated_at', 'notes', 'duration',
+    'status', 'payment_amount', 'payment_status', 'video_link',
+    'patient_name', 'doctor_name', 'doctor_specialty',
+]
+
+HISTORY_FIELDS = [
+    'id', 'date', 'status', 'payment_status', 'payment_amount', 'video_link',
+    'patient_name', 'doctor_name', 'doctor_specialty',
+]
+
+
+def archivable(before=None):
+    """Consultations terminées et payées dont la date est antérieure à `before`."""
+    if before is None:
+        before = timezone.now() - timedelta(days=settings.CONSULTATION_ARCHIVE_AFTER_DAYS)
+    return Consultation.objects.filter(status='completed', payment_status='paid', date__lt=before)
+
+
+def archive_batch(ids, using=None):
+    """Copie puis supprime un lot de consultations dans une transaction courte."""
+    using = using or router.db_for_write(Consultation)
+    with transaction.atomic(using=using):
+        rows = list(
+            Consultation.objects.using(using).select_for_update()
+            .filter(id__in=ids, status='completed', payment_status='paid')
+            .values(*ARCHIVED_FIELDS)
+        )
+        if not rows:
+            return 0
+        # Pas d'ignore_conflicts : un id déjà archivé fait échouer le lot entier (rollback),
+        # plutôt que de supprimer une consultation qui n'aurait pas été copiée
+        ArchivedConsultation.objects.using(using).bulk_create([ArchivedConsultation(**row) for row in rows])
+        Consultation.objects.using(using).filter(id__in=[row['id'] for row in rows]).delete()
+    return len(rows)
+
+
+def archive_consultations(before=None, batch_size=500):
+    """Archive par lots (ordonnés par id) ; retourne le nombre de consultations déplacées."""
+    total = 0
+    for using in shard_aliases():
+        last_id = 0
+        queryset = archivable(before).using(using).order_by('id')
+        while True:
+            ids = list(queryset.filter(id__gt=last_id).values_list('id', flat=True)[:batch_size])
+            if not ids:
+                break
+            total += archive_batch(ids, using=using)
+            last_id = ids[-1]
+    return total
+
+
+def all_consultations(*conditions, fields=HISTORY_FIELDS, **filters):
+    """
+    Historique complet (table chaude + archive) sous forme de dictionnaires, du plus récent au plus ancien.
+    Les conditions (Q) et filtres s'appliquent aux deux tables avant l'union ; `fields` doit contenir 'date' et 'id'.
+    Ex. : all_consultations(patient_id=request.user.pk)
+    """
+    recent = Consultation.objects.filter(*conditions, **filters).values(*fields)
+    archived = ArchivedConsultation.objects.filter(*conditions, **filters).values(*fields)
+    return recent.union(archived, all=True).order_by('-date', '-id')
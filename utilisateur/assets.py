@@ -0,0 +1,178 @@
+"""
+Outils pour la chaîne des fichiers statiques :
+- inventaire des fichiers réellement référencés par les templates (et par les CSS/JS qu'ils chargent),
+- construction des bundles CSS/JS (settings.STATIC_BUNDLES).
+"""
+import os
+import posixpath
+import re
+from functools import lru_cache
+
+from django.conf import settings
+
+STATIC_TAG_RE = re.compile(r"""\{%\s*static\s+['"]([^'"]+)['"]\s*%\}""")
+EXTENDS_RE = re.compile(r"""\{%\s*(?:extends|include)\s+['"]([^'"]+)['"]""")
+COMMENT_BLOCK_RE = re.compile(r"\{%\s*comment\s*%\}.*?\{%\s*endcomment\s*%\}", re.S)
+COMMENT_LINE_RE = re.compile(r"\{#.*?#\}")
+CSS_URL_RE = re.compile(r"""url\(\s*['"]?([^'")]+?)['"]?\s*\)""")
+CSS_IMPORT_RE = re.compile(r"""^\s*@(?:charset|import)\b[^;]*;\s*$""", re.M)
+CSS_COMMENT_RE = re.compile(r"/\*(?!!).*?\*/", re.S)
+SOURCE_MAP_RE = re.compile(r"""(?:/\*#|//#)\s*sourceMappingURL=([^\s*]+)\s*(?:\*/)?""")
+
+
+def static_dirs():
+    """Répertoires sources de settings.STATICFILES_DIRS (sans préfixe)."""
+    dirs = []
+    for entry in settings.STATICFILES_DIRS:
+        dirs.append(entry[1] if isinstance(entry, (list, tuple)) else entry)
+    return [os.fspath(d) for d in dirs]
+
+
+def template_dirs():
+    dirs = []
+    for backend in settings.TEMPLATES:
+        dirs.extend(os.fspath(d) for d in backend.get('DIRS', []))
+    return dirs
+
+
+def normalize(path):
+    return posixpath.normpath(path.replace('\\', '/')).lstrip('/')
+
+
+def find_source(path):
+    """Chemin absolu d'un fichier statique source, ou None s'il n'existe pas."""
+    for root in static_dirs():
+        candidate = os.path.join(root, *path.split('/'))
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+
+def _read_template(name):
+    for root in template_dirs():
+        full = os.path.join(root, *name.split('/'))
+        if os.path.isfile(full):
+            with open(full, encoding='utf-8') as fh:
+                return fh.read()
+    return None
+
+
+def _strip_comments(source):
+    return COMMENT_LINE_RE.sub('', COMMENT_BLOCK_RE.sub('', source))
+
+
+def template_assets(name, _seen=None):
+    """Fichiers statiques utilisés par un template, y compris ceux de ses parents / includes."""
+    seen = _seen if _seen is not None else set()
+    if name in seen:
+        return set()
+    seen.add(name)
+    source = _read_template(name)
+    if source is None:
+        return set()
+    source = _strip_comments(source)
+    assets = {normalize(path) for path in STATIC_TAG_RE.findall(source)}
+    for parent in EXTENDS_RE.findall(source):
+        # Les chemins relatifs ('./base.html') sont résolus depuis le template courant
+        if parent.startswith('.'):
+            parent = normalize(posixpath.join(posixpath.dirname(name), parent))
+        assets |= template_assets(parent, seen)
+    return assets
+
+
+def _asset_dependencies(path):
+    """Fichiers référencés depuis un CSS/JS (url(...) et sourceMappingURL)."""
+    if not path.endswith(('.css', '.js')):
+        return set()
+    source_path = find_source(path)
+    if source_path is None:
+        return set()
+    with open(source_path, encoding='utf-8', errors='ignore') as fh:
+        content = fh.read()
+    targets = SOURCE_MAP_RE.findall(content)
+    if path.endswith('.css'):
+        targets += CSS_URL_RE.findall(content)
+    deps = set()
+    for target in targets:
+        target = target.split('?', 1)[0].split('#', 1)[0]
+        if not target or target.startswith(('data:', 'http:', 'https:', '//', '/')):
+            continue
+        deps.add(normalize(posixpath.join(posixpath.dirname(path), target)))
+    return deps
+
+
+def with_dependencies(paths):
+    pending = list(paths)
+    result = set()
+    while pending:
+        path = pending.pop()
+        if path in result:
+            continue
+        result.add(path)
+        pending.extend(_asset_dependencies(path) - result)
+    return result
+
+
+def page_templates():
+    """Tous les templates HTML des répertoires settings.TEMPLATES['DIRS']."""
+    names = []
+    for root in template_dirs():
+        for dirpath, _, filenames in os.walk(root):
+            for filename in filenames:
+                if filename.endswith('.html'):
+                    rel = os.path.relpath(os.path.join(dirpath, filename), root)
+                    names.append(rel.replace(os.sep, '/'))
+    return sorted(names)
+
+
+@lru_cache(maxsize=1)
+def referenced_assets():
+    """Ensemble des fichiers statiques nécessaires à au moins une page."""
+    paths = set()
+    for name in page_templates():
+        paths |= template_assets(name)
+    paths |= set(settings.STATIC_BUNDLES)
+    return frozenset(with_dependencies(paths))
+
+
+def minify_css(content):
+    """Minification prudente : commentaires (hors /*! licences */) et espaces superflus."""
+    content = CSS_COMMENT_RE.sub('', content)
+    content = re.sub(r"\s+", ' ', content)
+    content = re.sub(r"\s*([{};,>])\s*", r"\1", content)
+    return content.replace(';}', '}').strip()
+
+
+def _rebase_css_urls(content, source, target):
+    """Réécrit les url() relatives d'un CSS déplacé de `source` vers `target`."""
+    def replace(match):
+        url = match.group(1)
+        if url.startswith(('data:', 'http:', 'https:', '//', '/', '#')):
+            return match.group(0)
+        absolute = normalize(posixpath.join(posixpath.dirname(source), url))
+        return f'url("{posixpath.relpath(absolute, posixpath.dirname(target))}")'
+    return CSS_URL_RE.sub(replace, content)
+
+
+def build_bundle(target, sources):
+    """Concatène les sources d'un bundle et retourne son contenu."""
+    is_css = target.endswith('.css')
+    header, parts = [], []
+    for source in sources:
+        source_path = find_source(source)
+        if source_path is None:
+            raise FileNotFoundError(f"Fichier statique introuvable : {source}")
+        with open(source_path, encoding='utf-8') as fh:
+            content = SOURCE_MAP_RE.sub('', fh.read())
+        if is_css:
+            content = _rebase_css_urls(content, source, target)
+            # @charset / @import doivent rester en tête du fichier final
+            for rule in CSS_IMPORT_RE.findall(content):
+                if rule.strip().startswith('@import') and rule.strip() not in header:
+                    header.append(rule.strip())
+            parts.append(minify_css(CSS_IMPORT_RE.sub('', content)))
+        else:
+            parts.append(content.strip().rstrip(';') + ';')
+    if is_css:
+        return '@charset "UTF-8";' + ''.join(header) + '\n'.join(parts) + '\n'
+    return '\n'.join(parts) + '\n'
@@ -0,0 +1,135 @@
+"""
+Journal d'audit des consultations (statut et paiement).
+
+Les valeurs d'origine sont mémorisées au chargement de l'instance (post_init),
+ce qui évite un SELECT supplémentaire avant chaque sauvegarde. Les entrées sont
+accumulées en mémoire puis écrites avec un seul bulk_create :
+- au commit de la transaction si la sauvegarde a lieu dans un bloc atomic,
+- à la fin de la requête sinon (AuditMiddleware),
+- immédiatement hors requête (commandes de gestion, shell).
+Le journal est sur "default" ; la transaction suivie est celle de la base où la
+consultation est enregistrée (base régionale, voir utilisateur/sharding.py).
+"""
+from contextvars import ContextVar
+
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.models.signals import post_init, post_save
+
+from .models import AuditLog, Consultation
+
+TRACKED_FIELDS = {
+    Consultation: ('status', 'payment_status', 'payment_amount'),
+}
+
+_request = ContextVar('audit_request', default=None)
+_buffer = ContextVar('audit_buffer', default=None)
+
+
+def _as_text(value):
+    return None if value is None else str(value)
+
+
+def current_actor():
+    request = _request.get()
+    user = getattr(request, 'user', None)
+    if user is not None and user.is_authenticated:
+        return user
+    return None
+
+
+def flush(entries):
+    if entries:
+        AuditLog.objects.bulk_create(entries)
+
+
+def _enqueue(entries, using=DEFAULT_DB_ALIAS):
+    if connections[using].in_atomic_block:
+        # Écrit seulement si la transaction est validée ; rien n'est journalisé en cas de rollback
+        transaction.on_commit(lambda: flush(entries), using=using)
+        return
+    buffer = _buffer.get()
+    if buffer is not None:
+        buffer.extend(entries)
+    else:
+        flush(entries)
+
+
+def record(model_name, object_id, changes, actor=None, using=DEFAULT_DB_ALIAS):
+    """
+    Journalise des changements faits hors signaux (ex. QuerySet.update()).
+    `changes` : itérable de (champ, ancienne valeur, nouvelle valeur).
+    """
+    actor = actor or current_actor()
+    _enqueue([
+        AuditLog(actor=actor, model_name=model_name, object_id=object_id,
+                 field=field, old_value=_as_text(old), new_value=_as_text(new))
+        for field, old, new in changes
+    ], using)
+
+
+def record_bulk(model_name, object_ids, field, old, new, actor=None, using=DEFAULT_DB_ALIAS):
+    """Même changement appliqué à plusieurs objets (ex. mise à jour en masse) : une seule écriture."""
+    actor = actor or current_actor()
+    _enqueue([
+        AuditLog(actor=actor, model_name=model_name, object_id=object_id,
+                 field=field, old_value=_as_text(old), new_value=_as_text(new))
+        for object_id in object_ids
+    ], using)
+
+
+def _snapshot(sender, instance, **kwargs):
+    # Champs différés (only()/defer()) ignorés : les lire rechargerait l'instance, qui
+    # déclencherait à nouveau post_init (récursion infinie)
+    instance._audit_original = {
+        field: instance.__dict__[field] for field in TRACKED_FIELDS[sender] if field in instance.__dict__
+    }
+
+
+def _log_changes(sender, instance, created, using=DEFAULT_DB_ALIAS, **kwargs):
+    original = getattr(instance, '_audit_original', {})
+    changes = []
+    for field in TRACKED_FIELDS[sender]:
+        if field not in instance.__dict__:
+            continue  # Toujours différé : ni lu ni modifié
+        new = instance.__dict__[field]
+        if created:
+            if new is not None:
+                changes.append((field, None, new))
+        elif field in original and original[field] != new:
+            changes.append((field, original[field], new))
+    if changes:
+        record(sender._meta.model_name, instance.pk, changes, using=using)
+    _snapshot(sender, instance)
+
+
+for _model in TRACKED_FIELDS:
+    post_init.connect(_snapshot, sender=_model, dispatch_uid=f'audit_snapshot_{_model.__name__}')
+    post_save.connect(_log_changes, sender=_model, dispatch_uid=f'audit_log_{_model.__name__}')
+
+
+class AuditMiddleware:
+    """Rattache les entrées d'audit à l'utilisateur courant et les écrit en une fois en fin de requête."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request_token = _request.set(request)
+        buffer = []
+        buffer_token = _buffer.set(buffer)
+        try:
+            return self.get_response(request)
+        finally:
+            _buffer.reset(buffer_token)
+            _request.reset(request_token)
+            flush(buffer)
+
+
+def history_for(model_name, object_id):
+    """Historique d'un objet, du plus récent au plus ancien (index audit_object_idx)."""
+    return AuditLog.objects.filter(model_name=model_name, object_id=object_id).order_by('-created_at')
+
+
+def changes_by(user):
+    """Tous les changements faits par un utilisateur (index audit_actor_idx)."""
+    return AuditLog.objects.filter(actor=user).order_by('-created_at')
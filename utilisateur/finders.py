@@ -0,0 +1,21 @@
+from django.conf import settings
+from django.contrib.staticfiles.finders import FileSystemFinder
+
+from .assets import referenced_assets
+
+
+class ReferencedFileSystemFinder(FileSystemFinder):
+    """
+    FileSystemFinder qui ne propose à collectstatic que les fichiers réellement
+    référencés par les templates (voir utilisateur.assets.referenced_assets).
+    find() reste inchangé : en développement tout le répertoire static/ est servi.
+    """
+
+    def list(self, ignore_patterns):
+        if not settings.STATIC_PRUNE_UNUSED:
+            yield from super().list(ignore_patterns)
+            return
+        wanted = referenced_assets()
+        for path, storage in super().list(ignore_patterns):
+            if path.replace('\\', '/') in wanted:
+                yield path, storage
@@ -1,4 +1,5 @@
 from django import forms
+from django.conf import settings
 from django.contrib.auth.forms import UserCreationForm, AuthenticationForm, PasswordResetForm
 # from django.contrib.auth.models import User
 from django.contrib.auth import get_user_model
@@ -31,6 +32,15 @@ class CustomAuthenticationForm(AuthenticationForm):
         })
     )
 
+# Choix de la région (base de données du compte) seulement si plusieurs bases sont configurées
+def set_region_field(form):
+    if settings.SHARDS:
+        form.fields['region'] = forms.ChoiceField(
+            label="Région", choices=[(region, region) for region in settings.SHARDS], initial=settings.DEFAULT_REGION,
+        )
+    else:
+        del form.fields['region']
+
 # Formulaires d'inscription spécifiques
 class PatientRegistrationForm(UserCreationForm):
     phone_number = forms.CharField(max_length=15)
@@ -38,10 +48,11 @@ class PatientRegistrationForm(UserCreationForm):
 
     class Meta:
         model = User
-        fields = ('username', 'email', 'password1', 'password2', 'phone_number', 'address')
+        fields = ('username', 'email', 'password1', 'password2', 'phone_number', 'address', 'region')
         
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        set_region_field(self)
 
         # Labels en français
         self.fields['username'].label = "Nom d’utilisateur"
@@ -116,10 +127,11 @@ class DoctorRegistrationForm(UserCreationForm):
 
     class Meta:
         model = User
-        fields = ('username', 'email', 'password1', 'password2', 'specialty', 'license_number')
+        fields = ('username', 'email', 'password1', 'password2', 'specialty', 'license_number', 'region')
         
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        set_region_field(self)
 
         # Custom labels
         self.fields['username'].label = "Nom d’utilisateur"
@@ -168,7 +180,9 @@ class ConsultationForm(forms.ModelForm):
         
         self.fields['doctor'].error_messages = {
             'required' : 'La selection du docteur est obligatoire ',
-            'invalid'  : 'selectionner un docteur valide '
+            'invalid'  : 'selectionner un docteur valide ',
+            # Médecin inconnu ou d'une autre région (utilisateur/sharding.py)
+            'invalid_choice' : 'selectionner un docteur valide '
         }  
         self.fields['notes'].error_messages = {
             'required' : 'La note est obligatoire ',
@@ -205,6 +219,22 @@ class ConsultationForm(forms.ModelForm):
                     'style': 'background-color: #f9f9f9; border: 1px solid #ddd;'
                 })     
         
+# Formulaire d'entrée en salle d'attente (consultation sans rendez-vous).
+# Pas de priorité ici : le patient entre en priorité normale, l'urgence est fixée par le personnel (admin)
+class WaitingRoomForm(forms.Form):
+    specialty = forms.ChoiceField(label="Spécialité")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Spécialités des médecins de la région du patient
+        specialties = Doctor.objects.order_by('specialty').values_list('specialty', flat=True).distinct()
+        self.fields['specialty'].choices = [(specialty, specialty) for specialty in specialties]
+        for field in self.fields.values():
+            field.widget.attrs.update({
+                'class': 'form-control form-control-lg rounded-3',
+                'style': 'background-color: #f9f9f9; border: 1px solid #ddd;'
+            })
+
 class CustomPasswordResetForm(PasswordResetForm):
     email = forms.EmailField(
         max_length=254,
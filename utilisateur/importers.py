@@ -0,0 +1,157 @@
+"""
+Import en masse de comptes patients / médecins depuis un CSV.
+
+Les lignes sont lues en flux et traitées par lots : validation, hachage des mots
+de passe en parallèle, puis bulk_create de User + profil dans une transaction
+par lot. Une ligne invalide est signalée sans interrompre le lot.
+"""
+import csv
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+from django.contrib.auth.hashers import make_password
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db import IntegrityError, transaction
+
+from .models import User, Patient, Doctor
+
+PROFILES = {
+    'patient': (Patient, 'is_patient', ('phone_number', 'address')),
+    'doctor': (Doctor, 'is_doctor', ('specialty', 'license_number')),
+}
+
+
+class ImportResult:
+    def __init__(self):
+        self.created = 0
+        self.errors = []  # (numéro de ligne, message)
+
+    def error(self, line, message):
+        self.errors.append((line, message))
+
+
+def _max_length(model, field):
+    return model._meta.get_field(field).max_length
+
+
+def validate_row(row, kind):
+    """Retourne la liste des erreurs d'une ligne (vide si la ligne est valide)."""
+    profile_model, _, profile_fields = PROFILES[kind]
+    errors = []
+    username = (row.get('username') or '').strip()
+    if not username:
+        errors.append("username manquant")
+    else:
+        try:
+            User.username_validator(username)
+        except ValidationError:
+            errors.append(f"username invalide : {username}")
+        if len(username) > _max_length(User, 'username'):
+            errors.append("username trop long")
+    email = (row.get('email') or '').strip()
+    if email:
+        try:
+            validate_email(email)
+        except ValidationError:
+            errors.append(f"email invalide : {email}")
+    for field in profile_fields:
+        value = (row.get(field) or '').strip()
+        max_length = _max_length(profile_model, field)
+        if not value and field != 'address':
+            errors.append(f"{field} manquant")
+        elif max_length and len(value) > max_length:
+            errors.append(f"{field} trop long")
+    if kind == 'patient' and not (row.get('address') or '').strip():
+        errors.append("address manquant")
+    return errors
+
+
+def _hash_passwords(rows, executor):
+    # pbkdf2_hmac relâche le GIL : un pool de threads suffit à paralléliser le hachage.
+    # Sans mot de passe, le compte est créé inutilisable (réinitialisation par email).
+    return list(executor.map(lambda row: make_password((row.get('password') or None)), rows))
+
+
+def _build(row, kind, password):
+    profile_model, flag, profile_fields = PROFILES[kind]
+    user = User(
+        username=row['username'].strip(),
+        email=(row.get('email') or '').strip(),
+        first_name=(row.get('first_name') or '').strip(),
+        last_name=(row.get('last_name') or '').strip(),
+        password=password,
+        **{flag: True},
+    )
+    profile = {field: (row.get(field) or '').strip() for field in profile_fields}
+    return user, profile_model, profile
+
+
+def _create_one(line, user, profile_model, profile, result):
+    try:
+        with transaction.atomic():
+            user.save()
+            profile_model.objects.create(user=user, **profile)
+        result.created += 1
+    except IntegrityError as exc:
+        result.error(line, f"erreur base de données : {exc}")
+
+
+def _import_batch(batch, kind, executor, result, seen):
+    valid = []
+    for line, row in batch:
+        errors = validate_row(row, kind)
+        username = (row.get('username') or '').strip()
+        if not errors and username in seen:
+            errors.append(f"username en double dans le fichier : {username}")
+        if errors:
+            result.error(line, '; '.join(errors))
+            continue
+        seen.add(username)
+        valid.append((line, row))
+
+    # Une seule requête par lot pour détecter les comptes existants
+    existing = set(User.objects.filter(
+        username__in=[row['username'].strip() for _, row in valid]
+    ).values_list('username', flat=True))
+    rows = []
+    for line, row in valid:
+        if row['username'].strip() in existing:
+            result.error(line, f"username déjà utilisé : {row['username'].strip()}")
+        else:
+            rows.append((line, row))
+    if not rows:
+        return
+
+    passwords = _hash_passwords([row for _, row in rows], executor)
+    built = [(line, *_build(row, kind, password)) for (line, row), password in zip(rows, passwords)]
+    profile_model = PROFILES[kind][0]
+    try:
+        with transaction.atomic():
+            users = User.objects.bulk_create([user for _, user, _, _ in built])
+            profile_model.objects.bulk_create([
+                profile_model(user=user, **profile)
+                for user, (_, _, _, profile) in zip(users, built)
+            ])
+        result.created += len(built)
+    except IntegrityError:
+        # Conflit concurrent : on rejoue le lot ligne par ligne pour isoler les lignes fautives
+        for line, user, model, profile in built:
+            user.pk = None
+            _create_one(line, user, model, profile, result)
+
+
+def import_accounts(fileobj, kind, batch_size=500, workers=None):
+    """Importe les comptes d'un CSV ouvert en mode texte et retourne un ImportResult."""
+    if kind not in PROFILES:
+        raise ValueError(f"Type de compte inconnu : {kind}")
+    result = ImportResult()
+    seen = set()
+    rows = enumerate(csv.DictReader(fileobj), start=2)  # ligne 1 = en-tête
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                break
+            _import_batch(batch, kind, executor, result, seen)
+    return result
@@ -0,0 +1,23 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from utilisateur.archive import archive_consultations
+
+
+class Command(BaseCommand):
+    help = "Déplace les consultations terminées et payées anciennes vers la table d'archive, par petits lots."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--older-than-days', type=int, default=settings.CONSULTATION_ARCHIVE_AFTER_DAYS,
+            help="Âge minimal (date de consultation) en jours.",
+        )
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        before = timezone.now() - timedelta(days=options['older_than_days'])
+        moved = archive_consultations(before=before, batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"{moved} consultation(s) archivée(s)."))
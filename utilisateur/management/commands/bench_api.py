@@ -0,0 +1,55 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+
+from utilisateur.models import User
+
+
+class Command(BaseCommand):
+    help = "Compare le tableau de bord HTML et l'API JSON v1 (temps, octets, requêtes SQL) pour un utilisateur."
+
+    def add_arguments(self, parser):
+        parser.add_argument('username')
+        parser.add_argument('--iterations', type=int, default=50)
+        parser.add_argument('--fields', default='date,status,video_link')
+
+    def _measure(self, client, url, iterations, **extra):
+        client.get(url, **extra)  # échauffement (templates, connexions)
+        queries = []
+
+        def count(execute, sql, params, many, context):
+            queries.append(sql)
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(count):
+            response = client.get(url, **extra)
+        start = time.perf_counter()
+        for _ in range(iterations):
+            client.get(url, **extra)
+        elapsed = (time.perf_counter() - start) / iterations
+        return elapsed, len(response.content), len(queries), response.status_code
+
+    def handle(self, *args, **options):
+        try:
+            user = User.objects.get(username=options['username'])
+        except User.DoesNotExist:
+            raise CommandError(f"Utilisateur introuvable : {options['username']}")
+        if not (user.is_patient or user.is_doctor):
+            raise CommandError("L'utilisateur doit être patient ou médecin.")
+
+        client = Client(HTTP_HOST='localhost')
+        client.force_login(user)
+        dashboard = '/accounts/doctor/dashboard/' if user.is_doctor else '/accounts/patient/dashboard/'
+        api = f"/accounts/api/v1/consultations/?fields={options['fields']}&limit=100"
+        iterations = options['iterations']
+
+        rows = [
+            ('HTML', *self._measure(client, dashboard, iterations)),
+            ('API', *self._measure(client, api, iterations)),
+            ('API gzip', *self._measure(client, api, iterations, HTTP_ACCEPT_ENCODING='gzip')),
+        ]
+        self.stdout.write(f"{'':10} {'ms/req':>8} {'octets':>10} {'SQL':>5} {'HTTP':>5}")
+        for name, elapsed, size, queries, status in rows:
+            self.stdout.write(f"{name:10} {elapsed * 1000:8.2f} {size:10} {queries:5} {status:5}")
@@ -0,0 +1,59 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from utilisateur.models import Consultation
+
+
+class Command(BaseCommand):
+    help = "Compare la lecture des noms affichés : jointures / N+1 contre colonnes dénormalisées."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=500)
+        parser.add_argument('--iterations', type=int, default=20)
+
+    def _measure(self, func, iterations):
+        queries = []
+
+        def count(execute, sql, params, many, context):
+            queries.append(sql)
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(count):
+            func()
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        return (time.perf_counter() - start) / iterations, len(queries)
+
+    def handle(self, *args, **options):
+        rows, iterations = options['rows'], options['iterations']
+        base = Consultation.objects.order_by('-date')[:rows]
+
+        def lazy():
+            # Ce que faisaient les templates : consultation.patient.user.username
+            return [(c.patient.user.username, c.doctor.user.username, c.doctor.specialty) for c in base]
+
+        def joined():
+            return list(base.values_list('patient__user__username', 'doctor__user__username', 'doctor__specialty'))
+
+        def related():
+            return [
+                (c.patient.user.username, c.doctor.user.username, c.doctor.specialty)
+                for c in base.select_related('patient__user', 'doctor__user')
+            ]
+
+        def denormalized():
+            return list(base.values_list('patient_name', 'doctor_name', 'doctor_specialty'))
+
+        self.stdout.write(f"{rows} consultations, moyenne sur {iterations} itérations")
+        self.stdout.write(f"{'':28} {'ms':>8} {'SQL':>6}")
+        for name, func, n in [
+            ('accès paresseux (N+1)', lazy, max(iterations // 10, 1)),
+            ('select_related (5 tables)', related, iterations),
+            ('values() avec jointures', joined, iterations),
+            ('colonnes dénormalisées', denormalized, iterations),
+        ]:
+            elapsed, queries = self._measure(func, n)
+            self.stdout.write(f"{name:28} {elapsed * 1000:8.2f} {queries:6}")
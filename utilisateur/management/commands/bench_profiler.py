@@ -0,0 +1,51 @@
+import tempfile
+import time
+
+from django.core.management.base import BaseCommand
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+
+from utilisateur.profiling import SamplingProfilerMiddleware
+
+
+class Command(BaseCommand):
+    help = "Mesure le surcoût du middleware de profilage (désactivé, actif non tiré au sort, profilé)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=100000)
+
+    def _time(self, handler, request, iterations):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            handler(request)
+        return (time.perf_counter() - start) / iterations
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+        request = RequestFactory().get('/')
+        response = HttpResponse()
+
+        def view(request):
+            return response
+
+        baseline = self._time(view, request, iterations)
+
+        with override_settings(PROFILER_ENABLED=False):
+            try:
+                SamplingProfilerMiddleware(view)
+                disabled = 'chargé'
+            except MiddlewareNotUsed:
+                disabled = 'retiré de la chaîne (0 µs)'
+
+        with override_settings(PROFILER_ENABLED=True, PROFILER_SAMPLE_RATE=0.0):
+            idle = self._time(SamplingProfilerMiddleware(view), request, iterations)
+
+        with tempfile.TemporaryDirectory() as output_dir, override_settings(
+            PROFILER_ENABLED=True, PROFILER_SAMPLE_RATE=1.0, PROFILER_OUTPUT_DIR=output_dir,
+        ):
+            profiled = self._time(SamplingProfilerMiddleware(view), request, max(iterations // 100, 10))
+
+        self.stdout.write(f"Désactivé                   : {disabled}")
+        self.stdout.write(f"Actif, requête non tirée    : {(idle - baseline) * 1e6:8.2f} µs/requête")
+        self.stdout.write(f"Requête profilée            : {(profiled - baseline) * 1e6:8.2f} µs/requête")
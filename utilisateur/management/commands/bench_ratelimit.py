@@ -0,0 +1,45 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.test import RequestFactory
+
+from utilisateur.ratelimit import get_limiter
+from utilisateur.views import CustomLoginView
+
+
+class Command(BaseCommand):
+    help = "Mesure le coût d'une requête de connexion rejetée par la limitation de débit."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=10000)
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+        factory = RequestFactory()
+        view = CustomLoginView.as_view()
+        data = {'username': 'bench-user', 'password': 'x'}
+        limiter = get_limiter('login')
+
+        # On épuise le quota de l'IP de test pour ne mesurer que le chemin rejeté
+        for _ in range(limiter.limit):
+            limiter.hit('ip:203.0.113.9')
+
+        request = factory.post('/accounts/login/', data, REMOTE_ADDR='203.0.113.9')
+        response = view(request)
+        if response.status_code != 429:
+            self.stderr.write(f"Réponse inattendue : {response.status_code}")
+            return
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            view(factory.post('/accounts/login/', data, REMOTE_ADDR='203.0.113.9'))
+        rejected = (time.perf_counter() - start) / iterations
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            factory.post('/accounts/login/', data, REMOTE_ADDR='203.0.113.9')
+        baseline = (time.perf_counter() - start) / iterations
+
+        self.stdout.write(f"Requête rejetée (429)       : {rejected * 1e6:8.1f} µs")
+        self.stdout.write(f"dont construction requête  : {baseline * 1e6:8.1f} µs")
+        self.stdout.write(f"Coût du limiteur + réponse : {(rejected - baseline) * 1e6:8.1f} µs")
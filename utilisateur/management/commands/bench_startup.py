@@ -0,0 +1,76 @@
+import json
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+# Exécuté dans un processus neuf pour mesurer un vrai démarrage à froid
+SCRIPT = """
+import json, time
+start = time.perf_counter()
+from TC.wsgi import application
+loaded = time.perf_counter()
+timings = {{}}
+if {warm}:
+    from TC.warmup import prepare
+    timings = prepare()
+warmed = time.perf_counter()
+from django.test import Client
+response = Client(HTTP_HOST='localhost').get({url!r})
+first = time.perf_counter()
+response = Client(HTTP_HOST='localhost').get({url!r})
+second = time.perf_counter()
+print(json.dumps({{
+    'import': loaded - start, 'warmup': warmed - loaded, 'first_request': first - warmed,
+    'second_request': second - first, 'status': response.status_code, 'steps': timings,
+}}))
+"""
+
+
+class Command(BaseCommand):
+    help = "Mesure le démarrage à froid : temps d'import par module et délai jusqu'à la première réponse."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--url', default='/accounts/login/')
+        parser.add_argument('--top', type=int, default=15, help="Nombre de modules les plus lents affichés.")
+
+    def _run(self, warm, url, importtime=False):
+        cmd = [sys.executable]
+        if importtime:
+            cmd += ['-X', 'importtime']
+        cmd += ['-c', SCRIPT.format(warm=warm, url=url)]
+        env = {**os.environ, 'DJANGO_SETTINGS_MODULE': os.environ.get('DJANGO_SETTINGS_MODULE', 'TC.settings')}
+        proc = subprocess.run(cmd, capture_output=True, text=True, cwd=settings.BASE_DIR, env=env)
+        if proc.returncode:
+            raise RuntimeError(proc.stderr[-2000:])
+        return json.loads(proc.stdout.strip().splitlines()[-1]), proc.stderr
+
+    def handle(self, *args, **options):
+        url = options['url']
+        _, stderr = self._run(False, url, importtime=True)
+        modules = []
+        for line in stderr.splitlines():
+            if not line.startswith('import time:') or 'cumulative' in line:
+                continue
+            self_us, cumulative_us, name = line.split(':', 1)[1].split('|')
+            # L'indentation du nom indique la profondeur d'import
+            modules.append((int(cumulative_us), int(self_us), name.rstrip()[1:]))
+
+        self.stdout.write(f"{'module':50} {'cumul ms':>10} {'propre ms':>10}")
+        top_level = [m for m in modules if not m[2].startswith(' ')]
+        for cumulative, own, name in sorted(modules, reverse=True)[:options['top']]:
+            self.stdout.write(f"{name.strip()[:50]:50} {cumulative / 1000:10.1f} {own / 1000:10.1f}")
+        self.stdout.write(f"Total des imports de premier niveau : {sum(m[0] for m in top_level) / 1000:.1f} ms")
+        self.stdout.write('')
+
+        for warm in (False, True):
+            result, _ = self._run(warm, url)
+            label = 'avec préchauffage' if warm else 'sans préchauffage'
+            self.stdout.write(
+                f"{label:18} : import {result['import'] * 1000:7.1f} ms, "
+                f"préchauffage {result['warmup'] * 1000:7.1f} ms, "
+                f"1re requête {result['first_request'] * 1000:7.1f} ms, "
+                f"2e requête {result['second_request'] * 1000:6.1f} ms (HTTP {result['status']})"
+            )
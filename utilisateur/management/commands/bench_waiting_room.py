@@ -0,0 +1,68 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import router, transaction
+
+from utilisateur.models import Doctor, Patient, WaitingRoomEntry
+from utilisateur.waiting_room import WaitingQueue, WaitingRoom
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "Débit de la salle d'attente : file en mémoire seule, puis avec persistance (annulée en fin de mesure)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--operations', type=int, default=100000, help="Opérations sur la file en mémoire.")
+        parser.add_argument('--patients', type=int, default=2000, help="Patients mis en attente avec persistance.")
+
+    def _rate(self, label, count, elapsed):
+        self.stdout.write(f"{label:38} {count:8} op  {elapsed * 1000:9.1f} ms  {count / elapsed:10.0f} op/s")
+
+    def handle(self, *args, **options):
+        n = options['operations']
+        queue = WaitingQueue()
+        priorities = [random.choice((0, 1, 1, 1)) for _ in range(n)]
+        start = time.perf_counter()
+        for entry_id, priority in enumerate(priorities, start=1):
+            queue.push(entry_id, priority)
+        self._rate("mémoire : ajout", n, time.perf_counter() - start)
+        start = time.perf_counter()
+        for entry_id in range(1, n + 1, 100):
+            queue.ahead(entry_id, priorities[entry_id - 1])
+        self._rate("mémoire : rang (bisect)", len(range(1, n + 1, 100)), time.perf_counter() - start)
+        start = time.perf_counter()
+        while queue:
+            queue.pop()
+        self._rate("mémoire : retrait", n, time.perf_counter() - start)
+
+        doctor = Doctor.objects.first()
+        patients = list(Patient.objects.all()[:options['patients']])
+        if doctor is None or not patients:
+            raise CommandError("Il faut au moins un médecin et un patient en base.")
+        using = router.db_for_write(WaitingRoomEntry)
+        try:
+            with transaction.atomic(using=using):
+                room = WaitingRoom(using)
+                start = time.perf_counter()
+                for patient in patients:
+                    room.enqueue(patient, doctor.specialty, random.choice((0, 1)))
+                self._rate("base : ajout (INSERT)", len(patients), time.perf_counter() - start)
+
+                room = WaitingRoom(using)  # Reprise après incident : relecture depuis la base
+                start = time.perf_counter()
+                room.load()
+                self._rate("base : reprise (relecture de la file)", len(room.entries), time.perf_counter() - start)
+
+                start = time.perf_counter()
+                served = 0
+                while room.next_patient(doctor.pk, doctor.specialty) is not None:
+                    served += 1
+                self._rate("base : prise en charge (+ Consultation)", served, time.perf_counter() - start)
+                raise Rollback
+        except Rollback:
+            pass
+        self.stdout.write(self.style.SUCCESS("Mesure terminée, aucune donnée conservée."))
@@ -0,0 +1,22 @@
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from utilisateur.assets import build_bundle, static_dirs
+
+
+class Command(BaseCommand):
+    help = "Construit les bundles CSS/JS définis dans settings.STATIC_BUNDLES (à lancer avant collectstatic)."
+
+    def handle(self, *args, **options):
+        root = static_dirs()[0]
+        for target, sources in settings.STATIC_BUNDLES.items():
+            content = build_bundle(target, sources)
+            path = os.path.join(root, *target.split('/'))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as fh:
+                fh.write(content)
+            self.stdout.write(self.style.SUCCESS(
+                f"{target} : {len(sources)} fichier(s), {len(content.encode()) / 1024:.1f} Ko"
+            ))
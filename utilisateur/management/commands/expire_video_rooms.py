@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from utilisateur.models import Consultation
+from utilisateur.rooms import release_room_url
+
+
+class Command(BaseCommand):
+    help = "Ferme les salles vidéo encore ouvertes des consultations terminées (données antérieures au cycle de vie)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        queryset = Consultation.objects.filter(status='completed', video_link__isnull=False)
+        total = 0
+        while True:
+            rows = list(queryset.values_list('id', 'video_link')[:options['batch_size']])
+            if not rows:
+                break
+            for _, url in rows:
+                release_room_url(url)
+            Consultation.objects.filter(id__in=[pk for pk, _ in rows]).update(video_link=None)
+            total += len(rows)
+        self.stdout.write(self.style.SUCCESS(f"{total} salle(s) fermée(s)."))
@@ -0,0 +1,33 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from utilisateur.importers import PROFILES, import_accounts
+
+
+class Command(BaseCommand):
+    help = (
+        "Importe des comptes patients ou médecins depuis un CSV "
+        "(colonnes : username, email, password, first_name, last_name + champs du profil)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('kind', choices=sorted(PROFILES))
+        parser.add_argument('csv_path')
+        parser.add_argument('--batch-size', type=int, default=500)
+        parser.add_argument('--workers', type=int, default=None,
+                            help="Threads de hachage des mots de passe (défaut : selon le nombre de CPU).")
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        with open(options['csv_path'], newline='', encoding='utf-8-sig') as fh:
+            result = import_accounts(
+                fh, options['kind'], batch_size=options['batch_size'], workers=options['workers'],
+            )
+        elapsed = time.perf_counter() - start
+
+        for line, message in result.errors:
+            self.stderr.write(f"ligne {line} : {message}")
+        self.stdout.write(self.style.SUCCESS(
+            f"{result.created} compte(s) créé(s), {len(result.errors)} erreur(s) en {elapsed:.1f} s."
+        ))
@@ -0,0 +1,21 @@
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+
+from utilisateur.sharding import legacy_row_counts, shard_aliases
+
+
+class Command(BaseCommand):
+    help = "Applique les migrations sur la base « default » puis sur chaque base régionale (DATABASE_SHARDS)."
+
+    def handle(self, *args, **options):
+        for alias in dict.fromkeys(['default', *shard_aliases()]):
+            self.stdout.write(f"== {alias}")
+            call_command('migrate', database=alias, interactive=False, verbosity=options['verbosity'])
+        self.stdout.write(self.style.SUCCESS("Toutes les bases sont à jour."))
+        legacy = legacy_row_counts()
+        if legacy:
+            # Lignes d'avant le partitionnement : le routeur ne les lit plus sur "default"
+            detail = ', '.join(f"{name} : {count}" for name, count in legacy.items())
+            self.stdout.write(self.style.WARNING(
+                f"Données restées sur « default » ({detail}) : lancez move_to_shards pour les rendre visibles."
+            ))
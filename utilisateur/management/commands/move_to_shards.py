@@ -0,0 +1,34 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from utilisateur.sharding import legacy_row_counts, misplaced_legacy_users, move_legacy_rows, shard_for_region
+
+
+class Command(BaseCommand):
+    help = (
+        "Déplace les patients, médecins, consultations et entrées de salle d'attente restés sur « default » "
+        "(créés avant DATABASE_SHARDS) vers la base de DEFAULT_REGION."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        if not settings.SHARDS:
+            raise CommandError("DATABASE_SHARDS n'est pas configuré : rien à déplacer.")
+        counts = legacy_row_counts()
+        if not counts:
+            self.stdout.write(self.style.SUCCESS("Aucune ligne à déplacer."))
+            return
+        # Ces comptes seraient cherchés dans une autre base que celle de leurs données
+        misplaced = misplaced_legacy_users()
+        if misplaced:
+            raise CommandError(
+                f"{len(misplaced)} compte(s) ont une région hors DEFAULT_REGION ({', '.join(misplaced[:10])}) : "
+                "videz leur région ou mettez-la à DEFAULT_REGION avant le déplacement."
+            )
+        target = shard_for_region(settings.DEFAULT_REGION)
+        moved = move_legacy_rows(batch_size=options['batch_size'])
+        for name, count in moved.items():
+            self.stdout.write(f"{name:22} {count:8}")
+        self.stdout.write(self.style.SUCCESS(f"{sum(moved.values())} ligne(s) déplacée(s) vers {target}."))
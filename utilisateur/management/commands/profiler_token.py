@@ -0,0 +1,12 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from utilisateur.profiling import make_profile_token
+
+
+class Command(BaseCommand):
+    help = "Génère un jeton pour l'en-tête X-Debug-Profile (profilage forcé d'une requête)."
+
+    def handle(self, *args, **options):
+        self.stdout.write(make_profile_token())
+        self.stderr.write(f"Valable {settings.PROFILER_TOKEN_MAX_AGE} s. Exemple : curl -H 'X-Debug-Profile: <jeton>' ...")
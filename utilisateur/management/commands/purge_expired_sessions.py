@@ -0,0 +1,47 @@
+import time
+
+from django.conf import settings
+from django.contrib.sessions.models import Session
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+
+class Command(BaseCommand):
+    help = "Supprime les sessions expirées par petits lots pour ne pas verrouiller la table django_session."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=settings.SESSION_PURGE_BATCH_SIZE,
+            help="Nombre de sessions supprimées par transaction.",
+        )
+        parser.add_argument(
+            '--pause', type=float, default=0.0,
+            help="Pause (en secondes) entre deux lots pour laisser passer le trafic.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        pause = options['pause']
+        now = timezone.now()
+        total = 0
+
+        while True:
+            # On ne lit que les clés : pas de désérialisation de session_data
+            keys = list(
+                Session.objects.filter(expire_date__lt=now)
+                .values_list('session_key', flat=True)[:batch_size]
+            )
+            if not keys:
+                break
+            # Une transaction courte par lot : les verrous sont relâchés entre deux lots
+            with transaction.atomic():
+                # Condition répétée : une session prolongée depuis la lecture des clés est conservée
+                deleted, _ = Session.objects.filter(session_key__in=keys, expire_date__lt=now).delete()
+            total += deleted
+            if len(keys) < batch_size:
+                break
+            if pause:
+                time.sleep(pause)
+
+        self.stdout.write(self.style.SUCCESS(f"{total} session(s) expirée(s) supprimée(s)."))
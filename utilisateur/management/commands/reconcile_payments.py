@@ -0,0 +1,41 @@
+import os
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from utilisateur.reconciliation import READERS, reconcile
+
+
+class Command(BaseCommand):
+    help = (
+        "Rapproche un relevé de paiements (colonnes : reference, amount, date) avec les consultations, "
+        "marque les consultations payées et écrit un rapport des anomalies."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('statement')
+        parser.add_argument('--format', choices=sorted(READERS), default=None,
+                            help="Format du relevé (déduit de l'extension par défaut).")
+        parser.add_argument('--report', default='-', help="Fichier CSV des anomalies ('-' : sortie standard).")
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--dry-run', action='store_true', help="N'écrit rien en base.")
+
+    def handle(self, *args, **options):
+        fmt = options['format'] or os.path.splitext(options['statement'])[1].lstrip('.').lower()
+        if fmt not in READERS:
+            raise CommandError(f"Format inconnu : {fmt}")
+
+        start = time.perf_counter()
+        report = sys.stdout if options['report'] == '-' else open(options['report'], 'w', newline='', encoding='utf-8')
+        try:
+            with open(options['statement'], newline='', encoding='utf-8-sig') as statement:
+                counts = reconcile(
+                    statement, fmt, report, batch_size=options['batch_size'], dry_run=options['dry_run'],
+                )
+        finally:
+            if report is not sys.stdout:
+                report.close()
+
+        summary = ', '.join(f"{kind} : {count}" for kind, count in sorted(counts.items()))
+        self.stderr.write(self.style.SUCCESS(f"{summary} ({time.perf_counter() - start:.1f} s)"))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from utilisateur.signals import resync_display_names
+
+
+class Command(BaseCommand):
+    help = "Recalcule patient_name, doctor_name et doctor_specialty des consultations (actives et archivées)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=5000)
+
+    def handle(self, *args, **options):
+        total = resync_display_names(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"{total} consultation(s) corrigée(s)."))
@@ -0,0 +1,37 @@
+import time
+from collections import Counter
+
+from django.core.management.base import BaseCommand
+from django.db.models import Count
+
+from utilisateur.archive import HISTORY_FIELDS
+from utilisateur.models import Consultation
+from utilisateur.sharding import fan_out, on_each_shard
+
+
+class Command(BaseCommand):
+    help = "Rapport toutes régions : consultations par statut et par base, et dernières consultations fusionnées par date."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--latest', type=int, default=10, help="Nombre de consultations récentes affichées.")
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        per_shard = on_each_shard(lambda alias: dict(
+            Consultation.objects.using(alias).values_list('status').annotate(n=Count('id')).order_by()
+        ))
+        totals = Counter()
+        for alias, counts in per_shard.items():
+            totals.update(counts)
+            detail = ', '.join(f"{status} : {n}" for status, n in sorted(counts.items())) or 'aucune'
+            self.stdout.write(f"{alias:20} {sum(counts.values()):8}  ({detail})")
+        self.stdout.write(f"{'total':20} {sum(totals.values()):8}")
+
+        latest = fan_out(Consultation.objects.values(*HISTORY_FIELDS), ['-date', '-id'], limit=options['latest'])
+        self.stdout.write('')
+        for row in latest:
+            self.stdout.write(
+                f"#{row['id']:<16} {row['date']:%Y-%m-%d %H:%M}  {row['status']:12} "
+                f"{row['patient_name']} / Dr. {row['doctor_name']}"
+            )
+        self.stdout.write(self.style.SUCCESS(f"{len(per_shard)} base(s) interrogée(s) en {time.perf_counter() - start:.2f} s."))
@@ -0,0 +1,80 @@
+import gzip
+import os
+
+from django.core.management.base import BaseCommand
+
+from utilisateur.assets import (
+    find_source, page_templates, referenced_assets, static_dirs, template_assets, with_dependencies,
+)
+
+try:
+    import brotli
+except ImportError:  # Brotli est optionnel pour le rapport
+    brotli = None
+
+# Formats déjà compressés : WhiteNoise ne leur crée pas de variante .gz/.br
+COMPRESSIBLE = ('.css', '.js', '.svg', '.html', '.json', '.map', '.txt')
+
+
+class Command(BaseCommand):
+    help = "Rapport des octets statiques envoyés par page (brut, gzip, brotli) et des fichiers inutilisés."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--unused', action='store_true', help="Lister les fichiers non référencés.")
+
+    def _sizes(self, path, cache={}):
+        if path not in cache:
+            with open(path, 'rb') as fh:
+                data = fh.read()
+            raw = len(data)
+            if path.endswith(COMPRESSIBLE):
+                gz = len(gzip.compress(data, 9))
+                br = len(brotli.compress(data)) if brotli else gz
+            else:
+                gz = br = raw
+            cache[path] = (raw, gz, br)
+        return cache[path]
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"{'page':45} {'fichiers':>8} {'brut Ko':>10} {'gzip Ko':>10} {'br Ko':>10}")
+        missing = set()
+        for name in page_templates():
+            assets = with_dependencies(template_assets(name))
+            totals = [0, 0, 0]
+            for asset in assets:
+                source = find_source(asset)
+                if source is None:
+                    missing.add((name, asset))
+                    continue
+                for i, size in enumerate(self._sizes(source)):
+                    totals[i] += size
+            self.stdout.write(
+                f"{name:45} {len(assets):8} " + ' '.join(f"{t / 1024:10.1f}" for t in totals)
+            )
+
+        used = referenced_assets()
+        all_files, used_bytes, all_bytes = 0, 0, 0
+        unused = []
+        for root in static_dirs():
+            for dirpath, _, filenames in os.walk(root):
+                for filename in filenames:
+                    full = os.path.join(dirpath, filename)
+                    rel = os.path.relpath(full, root).replace(os.sep, '/')
+                    size = os.path.getsize(full)
+                    all_files += 1
+                    all_bytes += size
+                    if rel in used:
+                        used_bytes += size
+                    else:
+                        unused.append(rel)
+
+        self.stdout.write('')
+        self.stdout.write(
+            f"Fichiers collectés : {len(used)} / {all_files} "
+            f"({used_bytes / 1048576:.1f} Mo / {all_bytes / 1048576:.1f} Mo)"
+        )
+        for name, asset in sorted(missing):
+            self.stderr.write(f"Référence introuvable dans {name} : {asset}")
+        if options['unused']:
+            for rel in sorted(unused):
+                self.stdout.write(f"  inutilisé : {rel}")
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.5 on 2026-10-19 11:15
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('utilisateur', '0002_alter_consultation_status'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedConsultation',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('date', models.DateTimeField()),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('notes', models.TextField(blank=True, null=True)),
+                ('duration', models.DurationField(blank=True, null=True)),
+                ('status', models.CharField(choices=[('pending', 'En attente'), ('in_progress', 'En cours'), ('completed', 'Terminée')], max_length=20)),
+                ('payment_amount', models.DecimalField(blank=True, decimal_places=2, max_digits=6, null=True)),
+                ('payment_status', models.CharField(choices=[('unpaid', 'Non payé'), ('paid', 'Payé')], max_length=20)),
+                ('video_link', models.URLField(blank=True, null=True)),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+                ('doctor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='utilisateur.doctor')),
+                ('patient', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='utilisateur.patient')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['patient', '-date'], name='archive_patient_date_idx'), models.Index(fields=['doctor', '-date'], name='archive_doctor_date_idx')],
+            },
+        ),
+    ]
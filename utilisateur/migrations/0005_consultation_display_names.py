@@ -0,0 +1,57 @@
+# Generated by Django 5.2.5 on 2026-10-19 11:24
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def fill_display_names(apps, schema_editor):
+    User = apps.get_model('utilisateur', 'User')
+    Doctor = apps.get_model('utilisateur', 'Doctor')
+    updates = {
+        'patient_name': Subquery(User.objects.filter(pk=OuterRef('patient_id')).values('username')[:1]),
+        'doctor_name': Subquery(User.objects.filter(pk=OuterRef('doctor_id')).values('username')[:1]),
+        'doctor_specialty': Subquery(Doctor.objects.filter(pk=OuterRef('doctor_id')).values('specialty')[:1]),
+    }
+    for name in ('Consultation', 'ArchivedConsultation'):
+        apps.get_model('utilisateur', name).objects.update(**updates)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('utilisateur', '0004_auditlog'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='archivedconsultation',
+            name='doctor_name',
+            field=models.CharField(blank=True, default='', max_length=150),
+        ),
+        migrations.AddField(
+            model_name='archivedconsultation',
+            name='doctor_specialty',
+            field=models.CharField(blank=True, default='', max_length=100),
+        ),
+        migrations.AddField(
+            model_name='archivedconsultation',
+            name='patient_name',
+            field=models.CharField(blank=True, default='', max_length=150),
+        ),
+        migrations.AddField(
+            model_name='consultation',
+            name='doctor_name',
+            field=models.CharField(blank=True, default='', max_length=150),
+        ),
+        migrations.AddField(
+            model_name='consultation',
+            name='doctor_specialty',
+            field=models.CharField(blank=True, default='', max_length=100),
+        ),
+        migrations.AddField(
+            model_name='consultation',
+            name='patient_name',
+            field=models.CharField(blank=True, default='', max_length=150),
+        ),
+        migrations.RunPython(fill_display_names, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.5 on 2026-10-19 11:30
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('utilisateur', '0005_consultation_display_names'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='region',
+            field=models.CharField(blank=True, default='', max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='doctor',
+            name='user',
+            field=models.OneToOneField(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, primary_key=True, serialize=False, to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='patient',
+            name='user',
+            field=models.OneToOneField(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, primary_key=True, serialize=False, to=settings.AUTH_USER_MODEL),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.5 on 2026-10-19 11:34
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('utilisateur', '0006_user_region_shards'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WaitingRoomEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('specialty', models.CharField(max_length=100)),
+                ('priority', models.PositiveSmallIntegerField(choices=[(0, 'Urgente'), (1, 'Normale')], default=1)),
+                ('status', models.CharField(choices=[('waiting', 'En attente'), ('matched', 'Prise en charge'), ('cancelled', 'Annulée')], default='waiting', max_length=20)),
+                ('enqueued_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('matched_at', models.DateTimeField(blank=True, null=True)),
+                ('consultation', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='utilisateur.consultation')),
+                ('patient', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='utilisateur.patient')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['status', 'id'], name='waiting_status_idx')],
+                'constraints': [models.UniqueConstraint(condition=models.Q(('status', 'waiting')), fields=('patient',), name='unique_waiting_patient')],
+            },
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.5 on 2026-10-19 14:02
+
+from django.db import DEFAULT_DB_ALIAS, migrations
+from django.db.models import Q
+
+
+def fill_display_names(apps, schema_editor):
+    # 0005 remplit les noms sur "default" seulement ; ici, chaque base (régionale comprise)
+    # complète ses propres lignes. User n'existe que sur "default" : noms lus là-bas.
+    db_alias = schema_editor.connection.alias
+    User = apps.get_model('utilisateur', 'User')
+    Doctor = apps.get_model('utilisateur', 'Doctor')
+    fields = ['patient_name', 'doctor_name', 'doctor_specialty']
+    for name in ('Consultation', 'ArchivedConsultation'):
+        model = apps.get_model('utilisateur', name)
+        queryset = model.objects.using(db_alias).filter(Q(patient_name='') | Q(doctor_name='')).order_by('id')
+        last_id = 0
+        while True:
+            rows = list(queryset.filter(id__gt=last_id).values_list('id', 'patient_id', 'doctor_id')[:1000])
+            if not rows:
+                break
+            last_id = rows[-1][0]
+            doctor_ids = {row[2] for row in rows}
+            names = dict(
+                User.objects.using(DEFAULT_DB_ALIAS)
+                .filter(pk__in=doctor_ids | {row[1] for row in rows}).values_list('pk', 'username')
+            )
+            specialties = dict(Doctor.objects.using(db_alias).filter(pk__in=doctor_ids).values_list('pk', 'specialty'))
+            model.objects.using(db_alias).bulk_update([
+                model(id=pk, patient_name=names.get(patient_id, ''), doctor_name=names.get(doctor_id, ''),
+                      doctor_specialty=specialties.get(doctor_id, ''))
+                for pk, patient_id, doctor_id in rows
+            ], fields)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('utilisateur', '0007_waitingroomentry'),
+    ]
+
+    operations = [
+        # hints : exécutée aussi sur les bases régionales (voir RegionRouter.allow_migrate)
+        migrations.RunPython(fill_display_names, migrations.RunPython.noop, hints={'model_name': 'consultation'}),
+    ]
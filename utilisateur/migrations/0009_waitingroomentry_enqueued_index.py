@@ -0,0 +1,21 @@
+# Generated by Django 5.2.5 on 2026-10-19 11:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('utilisateur', '0008_fill_display_names_per_database'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='waitingroomentry',
+            name='waiting_status_idx',
+        ),
+        migrations.AddIndex(
+            model_name='waitingroomentry',
+            index=models.Index(fields=['status', 'enqueued_at'], name='waiting_status_enqueued_idx'),
+        ),
+    ]
@@ -1,18 +1,21 @@
 from django.db import models
 from django.contrib.auth.models import AbstractUser
-import uuid
+from django.utils import timezone
+from . import rooms
 
 # Modèle d'utilisateur personnalisé hérité de AbstractUser
 class User(AbstractUser):
     is_patient = models.BooleanField(default=False)  # Indique si l'utilisateur est un patient
     is_doctor = models.BooleanField(default=False)   # Indique si l'utilisateur est un médecin
+    region = models.CharField(max_length=20, blank=True, default='')  # Base de ses données (settings.SHARDS), vide : DEFAULT_REGION
 
     def __str__(self):
         return self.username  # Représentation textuelle de l'utilisateur
 
 # Modèle pour les patients, lié à User via une relation OneToOne
+# Patient et Doctor sont dans la base de leur région, User sur "default" : pas de contrainte en base (utilisateur/sharding.py)
 class Patient(models.Model):
-    user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True)  # Lien unique vers User
+    user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, db_constraint=False)  # Lien unique vers User
     phone_number = models.CharField(max_length=15)  # Numéro de téléphone du patient
     address = models.TextField()  # Adresse physique du patient
 
@@ -21,13 +24,20 @@ class Patient(models.Model):
 
 # Modèle pour les médecins, lié à User via une relation OneToOne
 class Doctor(models.Model):
-    user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True)  # Lien unique vers User
+    user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, db_constraint=False)  # Lien unique vers User
     specialty = models.CharField(max_length=100)  # Spécialité médicale (ex. cardiologue)
     license_number = models.CharField(max_length=50)  # Numéro de licence professionnelle
 
     def __str__(self):
         return f"Dr. {self.user.username}"  # Représentation textuelle
 
+STATUS_CHOICES = [
+    ('pending', 'En attente'),
+    ('in_progress', 'En cours'),
+    ('completed', 'Terminée'),
+]
+PAYMENT_STATUS_CHOICES = [('unpaid', 'Non payé'), ('paid', 'Payé')]
+
 # Modèle pour les consultations, reliant patients et médecins
 class Consultation(models.Model):
     patient = models.ForeignKey(Patient, on_delete=models.CASCADE)  # Référence au patient
@@ -39,31 +49,141 @@ class Consultation(models.Model):
     duration = models.DurationField(blank=True, null=True)
     status = models.CharField(
         max_length=20,
-        choices=[
-            ('pending', 'En attente'),
-            ('in_progress', 'En cours'),  # <-- AJOUTER CE STATUT
-            ('completed', 'Terminée'),
-        ],
+        choices=STATUS_CHOICES,
         default='pending'
     )
     payment_amount = models.DecimalField(max_digits=6, decimal_places=2, null=True, blank=True)  # Montant à payer
     payment_status = models.CharField(
         max_length=20,
-        choices=[('unpaid', 'Non payé'), ('paid', 'Payé')],  # Statut du paiement
+        choices=PAYMENT_STATUS_CHOICES,  # Statut du paiement
         default='unpaid'
     )
     video_link = models.URLField(blank=True, null=True)  # Lien vers la vidéoconférence (ex. Jitsi)
+    # Copies dénormalisées pour l'affichage sans jointure (synchronisées par utilisateur/signals.py)
+    patient_name = models.CharField(max_length=150, blank=True, default='')
+    doctor_name = models.CharField(max_length=150, blank=True, default='')
+    doctor_specialty = models.CharField(max_length=100, blank=True, default='')
 
     def __str__(self):
-        return f"Consultation {self.patient} avec {self.doctor} le {self.date}"  # Représentation textuelle
+        return f"Consultation Patient: {self.patient_name} avec Dr. {self.doctor_name} le {self.date}"  # Représentation textuelle
     
     class Meta:
         constraints = [
             models.UniqueConstraint(fields=['doctor', 'date'], name='unique_doctor_date')
         ]
         
+    @property
+    def payment_reference(self):
+        """Référence à communiquer au prestataire de paiement (voir utilisateur/reconciliation.py)."""
+        return f"TC-{self.pk}"
+
+    def refresh_from_db(self, *args, **kwargs):
+        super().refresh_from_db(*args, **kwargs)
+        # Les valeurs d'origine du journal d'audit (utilisateur/audit.py) suivent l'état relu en base
+        if hasattr(self, '_audit_original'):
+            self._audit_original = {field: getattr(self, field) for field in self._audit_original}
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Noms dénormalisés lus en base : valables pour ce patient et ce médecin
+        instance._names_for = (instance.__dict__.get('patient_id'), instance.__dict__.get('doctor_id'))
+        return instance
+
+    def set_display_names(self, patient_name, doctor_name, doctor_specialty):
+        """Noms déjà connus de l'appelant (ex. salle d'attente) : save() n'a pas à les relire."""
+        self.patient_name, self.doctor_name, self.doctor_specialty = patient_name, doctor_name, doctor_specialty
+        self._names_for = (self.patient_id, self.doctor_id)
+
     def save(self, *args, **kwargs):
-        if not self.video_link:
-            unique_room_id = uuid.uuid4().hex  # Générer un ID unique
-            self.video_link = f"https://meet.jit.si/{unique_room_id}"
-        super().save(*args, **kwargs)    
\ No newline at end of file
+        changed = ['video_link']
+        if self.status == 'completed':
+            # Consultation terminée : la salle est fermée et le lien ne sert plus
+            if self.video_link:
+                rooms.release_room_url(self.video_link)
+                self.video_link = None
+        elif not self.video_link:
+            self.video_link = rooms.allocate_room_url()  # Salle prise dans la réserve pré-générée
+        # Création, ou patient / médecin réassigné : les noms affichés sont recalculés
+        if getattr(self, '_names_for', None) != (self.patient_id, self.doctor_id):
+            self.set_display_names(self.patient.user.username, self.doctor.user.username, self.doctor.specialty)
+            changed += ['patient_name', 'doctor_name', 'doctor_specialty']
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = list(dict.fromkeys([*update_fields, *changed]))
+        super().save(*args, **kwargs)
+
+# Consultations terminées et payées, déplacées hors de la table chaude par la commande archive_consultations.
+# L'id d'origine est conservé pour que les liens et l'historique restent valides.
+class ArchivedConsultation(models.Model):
+    id = models.BigIntegerField(primary_key=True)
+    patient = models.ForeignKey(Patient, on_delete=models.CASCADE)
+    doctor = models.ForeignKey(Doctor, on_delete=models.CASCADE)
+    date = models.DateTimeField()
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    notes = models.TextField(blank=True, null=True)
+    duration = models.DurationField(blank=True, null=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES)
+    payment_amount = models.DecimalField(max_digits=6, decimal_places=2, null=True, blank=True)
+    payment_status = models.CharField(max_length=20, choices=PAYMENT_STATUS_CHOICES)
+    video_link = models.URLField(blank=True, null=True)
+    patient_name = models.CharField(max_length=150, blank=True, default='')
+    doctor_name = models.CharField(max_length=150, blank=True, default='')
+    doctor_specialty = models.CharField(max_length=100, blank=True, default='')
+    archived_at = models.DateTimeField(auto_now_add=True)  # Date d'archivage
+
+    def __str__(self):
+        return f"Consultation archivée Patient: {self.patient_name} avec Dr. {self.doctor_name} le {self.date}"
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['patient', '-date'], name='archive_patient_date_idx'),
+            models.Index(fields=['doctor', '-date'], name='archive_doctor_date_idx'),
+        ]
+
+# Journal d'audit en ajout seul : qui a modifié quoi, avec ancienne et nouvelle valeur (voir utilisateur/audit.py)
+class AuditLog(models.Model):
+    actor = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='audit_logs')
+    model_name = models.CharField(max_length=50)  # ex. "consultation"
+    object_id = models.BigIntegerField()
+    field = models.CharField(max_length=50)
+    old_value = models.TextField(blank=True, null=True)
+    new_value = models.TextField(blank=True, null=True)
+    created_at = models.DateTimeField(default=timezone.now)  # Heure du changement (pas de l'écriture différée)
+
+    def __str__(self):
+        return f"{self.model_name} #{self.object_id} {self.field} : {self.old_value} -> {self.new_value}"
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['model_name', 'object_id', '-created_at'], name='audit_object_idx'),
+            models.Index(fields=['actor', '-created_at'], name='audit_actor_idx'),
+        ]
+
+
+WAITING_PRIORITY_CHOICES = [(0, 'Urgente'), (1, 'Normale')]
+WAITING_STATUS_CHOICES = [('waiting', 'En attente'), ('matched', 'Prise en charge'), ('cancelled', 'Annulée')]
+
+# Salle d'attente des consultations sans rendez-vous : copie persistante de la file en mémoire
+# (utilisateur/waiting_room.py), relue au redémarrage. Dans la base régionale du patient.
+class WaitingRoomEntry(models.Model):
+    patient = models.ForeignKey(Patient, on_delete=models.CASCADE)
+    specialty = models.CharField(max_length=100)  # Spécialité normalisée (minuscules)
+    priority = models.PositiveSmallIntegerField(choices=WAITING_PRIORITY_CHOICES, default=1)
+    status = models.CharField(max_length=20, choices=WAITING_STATUS_CHOICES, default='waiting')
+    enqueued_at = models.DateTimeField(default=timezone.now)  # Curseur de relecture des autres workers
+    matched_at = models.DateTimeField(blank=True, null=True)
+    consultation = models.OneToOneField(Consultation, on_delete=models.SET_NULL, blank=True, null=True)
+
+    def __str__(self):
+        return f"Salle d'attente {self.specialty} : patient #{self.patient_id} ({self.get_status_display()})"
+
+    class Meta:
+        constraints = [
+            # Un patient n'attend que dans une file à la fois
+            models.UniqueConstraint(fields=['patient'], condition=models.Q(status='waiting'), name='unique_waiting_patient'),
+        ]
+        indexes = [
+            models.Index(fields=['status', 'enqueued_at'], name='waiting_status_enqueued_idx'),
+        ]
@@ -0,0 +1,160 @@
+"""
+Profilage par échantillonnage des requêtes (opt-in, PROFILER_ENABLED).
+
+Une requête est profilée si elle est tirée au sort (PROFILER_SAMPLE_RATE) ou si
+elle porte un en-tête X-Debug-Profile signé (commande profiler_token). Pendant la
+requête, un thread relève la pile du thread qui la traite toutes les
+PROFILER_INTERVAL secondes ; les piles sont agrégées par vue au format
+« collapsed stacks » (flamegraph.pl, speedscope) et les requêtes SQL les plus
+lentes sont conservées (toutes les bases, y compris régionales). Chaque worker
+écrit ses propres fichiers <vue>.<pid>.folded / .sql.txt ; pour fusionner :
+`cat profiles/<vue>.*.folded` (flamegraph.pl additionne les lignes identiques).
+Désactivé, le middleware est retiré de la chaîne (MiddlewareNotUsed) : aucun surcoût.
+"""
+import heapq
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.core import signing
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+PROFILE_HEADER = 'HTTP_X_DEBUG_PROFILE'
+PROFILE_TOKEN_SALT = 'utilisateur.profiling'
+
+
+def make_profile_token():
+    return signing.dumps('profile', salt=PROFILE_TOKEN_SALT)
+
+
+def valid_profile_token(token, max_age):
+    try:
+        return signing.loads(token, salt=PROFILE_TOKEN_SALT, max_age=max_age) == 'profile'
+    except signing.BadSignature:
+        return False
+
+
+def _frame_name(frame):
+    return f"{frame.f_globals.get('__name__', '?')}.{frame.f_code.co_name}"
+
+
+def collapse(frame):
+    names = []
+    while frame is not None:
+        names.append(_frame_name(frame))
+        frame = frame.f_back
+    return ';'.join(reversed(names))
+
+
+class StackSampler(threading.Thread):
+    """Relève périodiquement la pile d'un autre thread."""
+
+    def __init__(self, thread_id, interval):
+        super().__init__(daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.stacks[collapse(frame)] += 1
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+        return self.stacks
+
+
+class ViewProfile:
+    """Piles et requêtes SQL lentes agrégées pour une vue."""
+
+    def __init__(self, slow_sql_count):
+        self.stacks = Counter()
+        self.slow_sql = []  # tas min de (durée, sql)
+        self.slow_sql_count = slow_sql_count
+        self.requests = 0
+
+    def add(self, stacks, queries):
+        self.requests += 1
+        self.stacks.update(stacks)
+        for item in queries:
+            if len(self.slow_sql) < self.slow_sql_count:
+                heapq.heappush(self.slow_sql, item)
+            else:
+                heapq.heappushpop(self.slow_sql, item)
+
+
+def _write(path, lines):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, 'w', encoding='utf-8') as fh:
+        fh.writelines(line + '\n' for line in lines)
+    os.replace(tmp, path)
+
+
+class SamplingProfilerMiddleware:
+    def __init__(self, get_response):
+        if not settings.PROFILER_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.sample_rate = settings.PROFILER_SAMPLE_RATE
+        self.interval = settings.PROFILER_INTERVAL
+        self.output_dir = settings.PROFILER_OUTPUT_DIR
+        self.token_max_age = settings.PROFILER_TOKEN_MAX_AGE
+        self.slow_sql_count = settings.PROFILER_SLOW_SQL
+        self.profiles = {}
+        self._lock = threading.Lock()
+        os.makedirs(self.output_dir, exist_ok=True)
+
+    def should_profile(self, request):
+        if self.sample_rate and random.random() < self.sample_rate:
+            return True
+        token = request.META.get(PROFILE_HEADER)
+        return bool(token) and valid_profile_token(token, self.token_max_age)
+
+    def __call__(self, request):
+        if not self.should_profile(request):
+            return self.get_response(request)
+
+        queries = []
+
+        def timed(execute, sql, params, many, context):
+            start = time.perf_counter()
+            try:
+                return execute(sql, params, many, context)
+            finally:
+                queries.append((time.perf_counter() - start, sql))
+
+        sampler = StackSampler(threading.get_ident(), self.interval)
+        sampler.start()
+        try:
+            with ExitStack() as stack:
+                for conn in connections.all():
+                    stack.enter_context(conn.execute_wrapper(timed))
+                response = self.get_response(request)
+        finally:
+            stacks = sampler.stop()
+
+        match = getattr(request, 'resolver_match', None)
+        view_name = (match.view_name if match else None) or 'unresolved'
+        self.record(view_name, stacks, queries)
+        return response
+
+    def record(self, view_name, stacks, queries):
+        with self._lock:
+            profile = self.profiles.setdefault(view_name, ViewProfile(self.slow_sql_count))
+            profile.add(stacks, queries)
+            # Profil propre au processus : un fichier par worker, jamais réécrit par un autre
+            base = os.path.join(self.output_dir, f"{view_name.replace(':', '.')}.{os.getpid()}")
+            _write(f"{base}.folded", [f"{stack} {count}" for stack, count in profile.stacks.most_common()])
+            _write(f"{base}.sql.txt", [
+                f"{duration * 1000:.2f} ms  {sql}" for duration, sql in sorted(profile.slow_sql, reverse=True)
+            ])
@@ -0,0 +1,170 @@
+"""
+Limitation de débit (rate limiting) pour la connexion et l'inscription.
+
+Algorithme « sliding window counter » : deux compteurs à fenêtre fixe (fenêtre
+courante et précédente) pondérés selon le temps écoulé. Les compteurs vivent
+dans le cache Django partagé (Redis en production) ; si le cache est
+indisponible, on bascule sur un stockage en mémoire locale au processus.
+"""
+import hashlib
+import threading
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+
+
+class LocalCounterStore:
+    """Compteurs en mémoire du processus, utilisés en secours du cache partagé."""
+
+    def __init__(self):
+        self._counters = {}
+        self._lock = threading.Lock()
+        self._next_purge = 0.0
+
+    def get_many(self, keys):
+        now = time.monotonic()
+        found = {}
+        for key in keys:
+            entry = self._counters.get(key)
+            if entry is not None and entry[1] > now:
+                found[key] = entry[0]
+        return found
+
+    def incr(self, key, ttl):
+        now = time.monotonic()
+        with self._lock:
+            if now >= self._next_purge:
+                # Nettoyage paresseux des compteurs expirés
+                self._counters = {k: v for k, v in self._counters.items() if v[1] > now}
+                self._next_purge = now + ttl
+            entry = self._counters.get(key)
+            if entry is None or entry[1] <= now:
+                entry = [0, now + ttl]
+                self._counters[key] = entry
+            entry[0] += 1
+            return entry[0]
+
+    def clear(self):
+        with self._lock:
+            self._counters.clear()
+
+
+class CacheCounterStore:
+    """Compteurs dans le cache Django (partagés entre workers si Redis est configuré)."""
+
+    def get_many(self, keys):
+        return cache.get_many(keys)
+
+    def incr(self, key, ttl):
+        if cache.add(key, 1, ttl):
+            return 1
+        try:
+            return cache.incr(key)
+        except ValueError:
+            # La clé a expiré entre add() et incr()
+            cache.set(key, 1, ttl)
+            return 1
+
+
+local_store = LocalCounterStore()
+cache_store = CacheCounterStore()
+
+
+class SlidingWindowLimiter:
+    """Autorise au plus ``limit`` requêtes par ``window`` secondes et par clé."""
+
+    def __init__(self, scope, limit, window, store=None, fallback=local_store):
+        self.scope = scope
+        self.limit = limit
+        self.window = window
+        self.store = store or cache_store
+        self.fallback = fallback
+
+    def _keys(self, ident, now):
+        digest = hashlib.blake2b(ident.encode(), digest_size=8).hexdigest()
+        index = int(now // self.window)
+        prefix = f"rl:{self.scope}:{digest}:"
+        return prefix + str(index), prefix + str(index - 1), now / self.window - index
+
+    def _estimate(self, store, current, previous, elapsed):
+        # Incrément atomique d'abord : deux workers ne peuvent pas passer tous deux sous la limite
+        count = store.incr(current, self.window * 2)
+        return count + store.get_many([previous]).get(previous, 0) * (1.0 - elapsed)
+
+    def hit(self, ident, now=None):
+        """
+        Comptabilise une tentative pour ``ident``.
+        Retourne False si la limite est dépassée (la tentative rejetée est comptée aussi).
+        """
+        now = time.time() if now is None else now
+        current, previous, elapsed = self._keys(ident, now)
+        try:
+            estimate = self._estimate(self.store, current, previous, elapsed)
+        except Exception:
+            # Cache indisponible : on continue avec les compteurs locaux
+            estimate = self._estimate(self.fallback, current, previous, elapsed)
+        return estimate <= self.limit
+
+
+def get_client_ip(request):
+    """
+    Chaque proxy de confiance ajoute à droite de X-Forwarded-For l'adresse qui s'est connectée
+    à lui : l'adresse du client est la RATELIMIT_TRUSTED_PROXIES-ième en partant de la droite.
+    Les entrées plus à gauche sont écrites par le client et ne sont jamais lues.
+    """
+    proxies = getattr(settings, 'RATELIMIT_TRUSTED_PROXIES', 0)
+    if proxies > 0:
+        forwarded = [ip.strip() for ip in request.META.get('HTTP_X_FORWARDED_FOR', '').split(',') if ip.strip()]
+        if len(forwarded) >= proxies:
+            return forwarded[-proxies]
+    return request.META.get('REMOTE_ADDR', '')
+
+
+_limiters = {}
+
+
+def get_limiter(scope):
+    limiter = _limiters.get(scope)
+    if limiter is None:
+        limit, window = settings.RATELIMITS[scope]
+        limiter = _limiters[scope] = SlidingWindowLimiter(scope, limit, window)
+    return limiter
+
+
+def is_rate_limited(request, scope):
+    """Vérifie l'IP puis le nom d'utilisateur soumis ; True si la requête doit être rejetée."""
+    limiter = get_limiter(scope)
+    if not limiter.hit('ip:' + get_client_ip(request)):
+        return True
+    username = request.POST.get('username', '').strip().lower()
+    if username and not limiter.hit('user:' + username):
+        return True
+    return False
+
+
+def rate_limited_response(scope):
+    response = HttpResponse(
+        "Trop de tentatives. Veuillez réessayer plus tard.",
+        status=429, content_type='text/plain; charset=utf-8',
+    )
+    response['Retry-After'] = str(settings.RATELIMITS[scope][1])
+    return response
+
+
+def ratelimit(scope):
+    """
+    Décorateur de vue : rejette les POST au-delà de la limite avant toute
+    validation de formulaire (donc avant le hachage du mot de passe).
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def _wrapped(request, *args, **kwargs):
+            if (request.method == 'POST' and settings.RATELIMIT_ENABLED
+                    and is_rate_limited(request, scope)):
+                return rate_limited_response(scope)
+            return view_func(request, *args, **kwargs)
+        return _wrapped
+    return decorator
@@ -0,0 +1,311 @@
+"""
+Rapprochement des paiements avec le relevé d'un prestataire.
+
+Le relevé (CSV, JSON Lines ou tableau JSON) est lu en flux, ligne par ligne. Les
+consultations non archivées sont indexées en mémoire (dictionnaires) :
+- par référence « TC-<id> » (Consultation.payment_reference),
+- par (montant, jour de consultation) pour les lignes sans référence.
+Seuls l'index et un lot de mises à jour sont gardés en mémoire : la taille du
+relevé n'influe pas sur la mémoire utilisée. Les consultations rapprochées passent
+à « paid » par lots (QuerySet.update) et chaque anomalie est écrite dans le rapport ;
+une ligne illisible (JSON invalide, élément qui n'est pas un objet) est signalée et la
+lecture continue.
+L'index couvre toutes les bases régionales ; l'id d'une consultation donne sa base.
+"""
+import csv
+import json
+import re
+from collections import Counter, defaultdict
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+
+from django.db import transaction
+from django.utils import timezone
+
+from . import audit
+from .models import Consultation
+from .sharding import shard_aliases, shard_for_consultation_id
+
+REPORT_FIELDS = ['line', 'kind', 'reference', 'amount', 'date', 'consultation_id', 'detail']
+
+
+MAX_JSON_ITEM_SIZE = 1 << 20  # Au-delà, un élément de tableau non décodable est considéré invalide
+_WHITESPACE = re.compile(r'\s*')
+_DELIMITERS = re.compile(r'["\[\]{},]')
+_STRING_DELIMITERS = re.compile(r'\\.|\\|"', re.DOTALL)
+
+
+class InvalidLine:
+    """Ligne du relevé qui n'a pas pu être décodée."""
+
+    def __init__(self, detail):
+        self.detail = detail
+
+
+def parse_reference(reference):
+    reference = str(reference or '').strip().upper()
+    if reference.startswith('TC-') and reference[3:].isdigit():
+        return int(reference[3:])
+    return None
+
+
+# Chaque lecteur produit des paires (numéro de ligne, entrée), numérotées comme import_accounts()
+def iter_csv(fh):
+    yield from enumerate(csv.DictReader(fh), start=2)  # ligne 1 = en-tête
+
+
+def iter_json_lines(fh):
+    for number, line in enumerate(fh, start=1):
+        line = line.strip()
+        if line:
+            try:
+                yield number, json.loads(line)
+            except ValueError as exc:
+                yield number, InvalidLine(str(exc))
+
+
+def _scan_element(buffer, pos, depth=0, in_string=False):
+    """
+    Cherche la fin d'un élément de tableau : virgule ou « ] » hors chaîne, au premier niveau.
+    Renvoie (fin, reprise, profondeur, dans_chaîne) ; fin vaut -1 si le tampon s'arrête avant,
+    la lecture reprend alors à « reprise » avec le même état.
+    """
+    while True:
+        match = (_STRING_DELIMITERS if in_string else _DELIMITERS).search(buffer, pos)
+        if match is None:
+            return -1, len(buffer), depth, in_string
+        token = match.group()
+        if token == '\\':
+            return -1, match.start(), depth, in_string  # Échappement coupé par la fin du bloc
+        pos = match.end()
+        if in_string:
+            if token == '"':
+                in_string = False
+        elif token == '"':
+            in_string = True
+        elif token in '[{':
+            depth += 1
+        elif depth:
+            if token != ',':
+                depth -= 1
+        elif token != '}':
+            return match.start(), pos, depth, in_string
+
+
+def iter_json_array(fh, chunk_size=65536):
+    """
+    Lit un tableau JSON élément par élément sans le charger entièrement (numéro = rang dans le tableau).
+    Les éléments sont décodés en place (raw_decode à une position) ; le tampon n'est compacté
+    qu'une fois par bloc lu. Un élément invalide (vide compris) est signalé puis sauté jusqu'à
+    la virgule suivante de premier niveau : les numéros des éléments suivants restent justes.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ''
+    pos = 0
+    number = 0
+    started = False
+    need_value = True
+    skipping = None  # (profondeur, dans_chaîne) pendant le saut d'un élément invalide trop long
+    while True:
+        chunk = fh.read(chunk_size)
+        buffer = buffer[pos:] + chunk
+        pos = 0
+        while True:
+            if not started:
+                pos = _WHITESPACE.match(buffer, pos).end()
+                if pos == len(buffer):
+                    break
+                if buffer[pos] != '[':
+                    raise ValueError("Le relevé JSON doit être un tableau.")
+                pos += 1
+                started = True
+                continue
+            if skipping is not None:
+                end, resume, *state = _scan_element(buffer, pos, *skipping)
+                if end == -1:
+                    pos, skipping = resume, tuple(state)
+                    break
+                pos, skipping = end, None
+            pos = _WHITESPACE.match(buffer, pos).end()
+            if pos == len(buffer):
+                break
+            if buffer[pos] == ']':
+                return
+            if buffer[pos] == ',':
+                if need_value:
+                    number += 1
+                    yield number, InvalidLine("Élément vide.")
+                need_value = True
+                pos += 1
+                continue
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+                after = _WHITESPACE.match(buffer, end).end()
+                if after == len(buffer) and chunk:
+                    break  # Un nombre peut continuer dans le bloc suivant : on relit l'élément
+                if after < len(buffer) and buffer[after] not in ',]':
+                    raise ValueError(f"Caractère inattendu après l'élément : {buffer[after]!r}")
+            except ValueError as exc:
+                end, resume, *state = _scan_element(buffer, pos)
+                if end == -1 and chunk and len(buffer) - pos < MAX_JSON_ITEM_SIZE:
+                    break  # Élément incomplet : on lit la suite
+                number += 1
+                yield number, InvalidLine(str(exc))
+                need_value = False
+                if end == -1:
+                    if not chunk:
+                        return
+                    pos, skipping = resume, tuple(state)
+                    break
+            else:
+                number += 1
+                yield number, item
+                need_value = False
+            pos = end
+        if not chunk:
+            return
+
+
+READERS = {'csv': iter_csv, 'jsonl': iter_json_lines, 'json': iter_json_array}
+
+
+def _parse_amount(value):
+    try:
+        return Decimal(str(value).strip()).quantize(Decimal('0.01'))
+    except (InvalidOperation, ValueError):
+        return None
+
+
+def _parse_day(value):
+    value = str(value or '').strip()
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value).date()
+    except ValueError:
+        try:
+            return date.fromisoformat(value[:10])
+        except ValueError:
+            return None
+
+
+class ConsultationIndex:
+    """Index en mémoire des consultations candidates au rapprochement."""
+
+    def __init__(self, queryset=None):
+        queryset = queryset if queryset is not None else Consultation.objects.all()
+        self.by_id = {}
+        self.by_amount_day = {}
+        rows = queryset.values_list('id', 'payment_amount', 'date', 'payment_status')
+        for using in shard_aliases():
+            for pk, amount, when, status in rows.using(using).iterator(chunk_size=5000):
+                amount = amount.quantize(Decimal('0.01')) if amount is not None else None
+                self.by_id[pk] = (amount, status)
+                if status == 'unpaid' and amount is not None:
+                    day = timezone.localtime(when).date() if timezone.is_aware(when) else when.date()
+                    self.by_amount_day.setdefault((amount, day), []).append(pk)
+
+
+class Reconciler:
+    def __init__(self, report_writer, batch_size=1000, dry_run=False, index=None):
+        self.report = report_writer
+        self.batch_size = batch_size
+        self.dry_run = dry_run
+        self.index = index or ConsultationIndex()
+        self.counts = Counter()
+        self._pending = []
+        self._seen = set()
+
+    def discrepancy(self, line, kind, entry, consultation_id=None, detail=''):
+        self.counts[kind] += 1
+        self.report.writerow({
+            'line': line, 'kind': kind, 'reference': entry.get('reference', ''),
+            'amount': entry.get('amount', ''), 'date': entry.get('date', ''),
+            'consultation_id': consultation_id or '', 'detail': detail,
+        })
+
+    def _match(self, line, entry, amount):
+        pk = parse_reference(entry.get('reference'))
+        if pk is not None:
+            if pk not in self.index.by_id:
+                self.discrepancy(line, 'unknown_reference', entry)
+                return None
+            return pk
+        day = _parse_day(entry.get('date'))
+        candidates = [
+            pk for pk in self.index.by_amount_day.get((amount, day), ()) if pk not in self._seen
+        ]
+        if not candidates:
+            self.discrepancy(line, 'unmatched', entry)
+            return None
+        if len(candidates) > 1:
+            self.discrepancy(line, 'ambiguous', entry, detail=f"{len(candidates)} consultations possibles")
+            return None
+        return candidates[0]
+
+    def process(self, line, entry):
+        self.counts['lines'] += 1
+        if isinstance(entry, InvalidLine):
+            self.discrepancy(line, 'invalid_line', {}, detail=entry.detail)
+            return
+        if not isinstance(entry, dict):
+            self.discrepancy(line, 'invalid_line', {}, detail=f"objet attendu, reçu {type(entry).__name__}")
+            return
+        amount = _parse_amount(entry.get('amount'))
+        if amount is None:
+            self.discrepancy(line, 'invalid_amount', entry)
+            return
+        pk = self._match(line, entry, amount)
+        if pk is None:
+            return
+        expected, status = self.index.by_id[pk]
+        if pk in self._seen:
+            self.discrepancy(line, 'duplicate_payment', entry, pk)
+            return
+        if expected is not None and expected != amount:
+            # La consultation reste disponible pour une ligne ultérieure au bon montant
+            self.discrepancy(line, 'amount_mismatch', entry, pk, f"attendu {expected}")
+            return
+        self._seen.add(pk)
+        if status == 'paid':
+            self.counts['already_paid'] += 1
+            return
+        self.counts['matched'] += 1
+        self._pending.append(pk)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        ids, self._pending = self._pending, []
+        if not ids or self.dry_run:
+            return
+        by_shard = defaultdict(list)
+        for pk in ids:
+            by_shard[shard_for_consultation_id(pk)].append(pk)
+        for using, shard_ids in by_shard.items():
+            with transaction.atomic(using=using):
+                # Seules les consultations encore impayées changent : ce sont elles qui sont journalisées
+                changed = list(
+                    Consultation.objects.using(using).select_for_update()
+                    .filter(id__in=shard_ids, payment_status='unpaid').values_list('id', flat=True)
+                )
+                if changed:
+                    Consultation.objects.using(using).filter(id__in=changed).update(
+                        payment_status='paid', updated_at=timezone.now(),
+                    )
+                    audit.record_bulk('consultation', changed, 'payment_status', 'unpaid', 'paid', using=using)
+            self.counts['updated'] += len(changed)
+
+    def run(self, entries):
+        for line, entry in entries:
+            self.process(line, entry)
+        self.flush()
+        return self.counts
+
+
+def reconcile(statement, fmt, report_fh, batch_size=1000, dry_run=False):
+    """Rapproche un relevé ouvert en mode texte ; écrit les anomalies en CSV dans `report_fh`."""
+    writer = csv.DictWriter(report_fh, fieldnames=REPORT_FIELDS)
+    writer.writeheader()
+    reconciler = Reconciler(writer, batch_size=batch_size, dry_run=dry_run)
+    return reconciler.run(READERS[fmt](statement))
@@ -0,0 +1,141 @@
+"""
+Cycle de vie des salles de visioconférence.
+
+- Fournisseur interchangeable (settings.VIDEO_ROOM_PROVIDER) : Jitsi en production,
+  LocalRoomProvider (factice, en mémoire) pour les tests et le développement.
+- Réserve de salles pré-générées par lots : une réservation est un popleft() en O(1).
+- La salle est fermée et le lien retiré quand la consultation passe à « completed ».
+- Jetons d'accès signés et à durée limitée, vérifiés sans requête en base.
+"""
+import secrets
+import threading
+from collections import deque
+
+from django.conf import settings
+from django.core import signing
+from django.utils.module_loading import import_string
+
+JOIN_TOKEN_SALT = 'utilisateur.rooms.join'
+
+
+class BaseRoomProvider:
+    """Interface d'un fournisseur de salles."""
+
+    base_url = ''
+
+    def create_rooms(self, count):
+        """Retourne `count` nouveaux identifiants de salle."""
+        raise NotImplementedError
+
+    def close_room(self, room_id):
+        """Libère / expire une salle (sans effet si le fournisseur ne le permet pas)."""
+
+    def room_url(self, room_id):
+        return f"{self.base_url}{room_id}"
+
+    def room_id(self, url):
+        if url and url.startswith(self.base_url):
+            return url[len(self.base_url):]
+        return None
+
+
+class JitsiProvider(BaseRoomProvider):
+    """meet.jit.si : les salles existent dès qu'on les rejoint, un identifiant aléatoire suffit."""
+
+    base_url = 'https://meet.jit.si/'
+
+    def create_rooms(self, count):
+        return [secrets.token_hex(16) for _ in range(count)]
+
+
+class LocalRoomProvider(BaseRoomProvider):
+    """Fournisseur factice : garde en mémoire les salles créées et fermées."""
+
+    base_url = 'https://rooms.local/'
+
+    def __init__(self):
+        self.created = []
+        self.closed = []
+
+    def create_rooms(self, count):
+        rooms = [f"room-{len(self.created) + i}-{secrets.token_hex(4)}" for i in range(count)]
+        self.created.extend(rooms)
+        return rooms
+
+    def close_room(self, room_id):
+        self.closed.append(room_id)
+
+
+class RoomPool:
+    """Réserve de salles pré-générées, rechargée par lots quand elle est vide."""
+
+    def __init__(self, provider, size):
+        self.provider = provider
+        self.size = size
+        self._rooms = deque()
+        self._lock = threading.Lock()
+
+    def refill(self):
+        with self._lock:
+            missing = self.size - len(self._rooms)
+            if missing > 0:
+                self._rooms.extend(self.provider.create_rooms(missing))
+
+    def acquire(self):
+        try:
+            return self._rooms.popleft()
+        except IndexError:
+            self.refill()
+            return self._rooms.popleft()
+
+    def __len__(self):
+        return len(self._rooms)
+
+
+_pool = None
+
+
+def get_provider():
+    return get_pool().provider
+
+
+def get_pool():
+    global _pool
+    if _pool is None:
+        provider = import_string(settings.VIDEO_ROOM_PROVIDER)()
+        _pool = RoomPool(provider, settings.VIDEO_ROOM_POOL_SIZE)
+    return _pool
+
+
+def reset_pool():
+    """Oublie la réserve courante (changement de fournisseur, tests)."""
+    global _pool
+    _pool = None
+
+
+def allocate_room_url():
+    pool = get_pool()
+    return pool.provider.room_url(pool.acquire())
+
+
+def release_room_url(url):
+    provider = get_provider()
+    room_id = provider.room_id(url)
+    if room_id:
+        provider.close_room(room_id)
+
+
+def make_join_token(consultation_id, user_id, room_url):
+    return signing.dumps(
+        {'c': consultation_id, 'u': user_id, 'r': room_url}, salt=JOIN_TOKEN_SALT, compress=True,
+    )
+
+
+def verify_join_token(token, max_age=None):
+    """Retourne le contenu du jeton, ou None s'il est invalide ou expiré."""
+    if max_age is None:
+        max_age = settings.VIDEO_JOIN_TOKEN_MAX_AGE
+    try:
+        return signing.loads(token, salt=JOIN_TOKEN_SALT, max_age=max_age)
+    except signing.BadSignature:  # inclut SignatureExpired
+        return None
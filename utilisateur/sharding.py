@@ -0,0 +1,304 @@
+"""
+Partitionnement des données par région (settings.SHARDS, voir DATABASE_SHARDS).
+
+- Patient, Doctor, Consultation, ArchivedConsultation et WaitingRoomEntry sont dans la base de
+  la région de l'utilisateur (User.region) ; User, sessions et journal d'audit restent
+  sur "default". Les bases régionales ont les tables partitionnées, plus User et les
+  tables auth/contenttypes, vides, pour les clés étrangères des migrations initiales
+  (Patient.user) ; "default" a toutes les tables.
+- RegionRouter choisit la base : celle de l'instance liée (hint) d'abord, sinon la
+  région active (RegionMiddleware pour l'utilisateur connecté, use_region() /
+  use_shard() ailleurs), sinon DEFAULT_REGION.
+- Les ids de consultation (et de salle d'attente) portent leur région : chaque base a
+  sa plage de 2**40 ids, shard_for_consultation_id() retrouve la base sans requête.
+- fan_out() interroge toutes les bases en parallèle et fusionne les résultats triés
+  (admin, rapports).
+Sans DATABASE_SHARDS, le routeur ne fait rien : tout reste sur "default".
+Changer User.region ne déplace pas les données existantes. Les lignes créées sur
+"default" avant DATABASE_SHARDS n'y sont plus lues : move_legacy_rows() (commande
+move_to_shards) les déplace dans la base de DEFAULT_REGION.
+"""
+import functools
+import heapq
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.apps import apps
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, MiddlewareNotUsed
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import Max
+
+SHARDED_MODELS = {'patient', 'doctor', 'consultation', 'archivedconsultation', 'waitingroomentry'}
+ID_RANGE_BITS = 40
+LEGACY_MOVE_ORDER = ('patient', 'doctor', 'consultation', 'archivedconsultation', 'waitingroomentry')  # Ordre des clés étrangères
+SHARD_DEPENDENCY_APPS = {'auth', 'contenttypes'}  # Tables de User, aussi créées sur les bases régionales
+
+# Alias de la base active, ou fonction qui le calcule (résolution paresseuse de request.user)
+_active = ContextVar('utilisateur_shard', default=None)
+
+
+def is_sharded(model):
+    return model._meta.app_label == 'utilisateur' and model._meta.model_name in SHARDED_MODELS
+
+
+def shard_aliases():
+    return list(settings.SHARDS.values()) or [DEFAULT_DB_ALIAS]
+
+
+def shard_for_region(region):
+    if not settings.SHARDS:
+        return DEFAULT_DB_ALIAS
+    return settings.SHARDS.get(region) or settings.SHARDS[settings.DEFAULT_REGION]
+
+
+def shard_for_user(user):
+    return shard_for_region(getattr(user, 'region', ''))
+
+
+def id_range_start(alias):
+    """Les consultations de `alias` ont des ids dans [start, start + 2**40)."""
+    aliases = list(settings.SHARDS.values())
+    return (aliases.index(alias) + 1) << ID_RANGE_BITS if alias in aliases else 0
+
+
+def shard_for_consultation_id(pk):
+    aliases = list(settings.SHARDS.values())
+    if not aliases:
+        return DEFAULT_DB_ALIAS
+    position = int(pk) >> ID_RANGE_BITS
+    if 1 <= position <= len(aliases):
+        return aliases[position - 1]
+    return shard_for_region(settings.DEFAULT_REGION)  # ids antérieurs au partitionnement
+
+
+def active_shard():
+    alias = _active.get()
+    if callable(alias):
+        alias = alias()
+    return alias or shard_for_region(settings.DEFAULT_REGION)
+
+
+@contextmanager
+def use_shard(alias):
+    token = _active.set(alias)
+    try:
+        yield alias
+    finally:
+        _active.reset(token)
+
+
+def use_region(region):
+    return use_shard(shard_for_region(region))
+
+
+def each_shard():
+    """Active chaque base tour à tour (commandes de maintenance)."""
+    for alias in shard_aliases():
+        with use_shard(alias):
+            yield alias
+
+
+def _instance_shard(instance):
+    if instance._meta.label_lower == settings.AUTH_USER_MODEL.lower():
+        return shard_for_user(instance)
+    if not is_sharded(instance):
+        return None
+    if instance._state.db:
+        return instance._state.db
+    # Instance pas encore enregistrée : base de l'objet dont elle dépend
+    for name in ('user', 'patient'):
+        try:
+            field = instance._meta.get_field(name)
+        except FieldDoesNotExist:
+            continue
+        if field.is_cached(instance):
+            return _instance_shard(getattr(instance, name))
+    return None
+
+
+class RegionRouter:
+    def _db_for_model(self, model, **hints):
+        if not settings.SHARDS or model.__module__ == '__fake__':
+            return None  # Modèles historiques des migrations : base migrée ou "default"
+        if not is_sharded(model):
+            return DEFAULT_DB_ALIAS
+        instance = hints.get('instance')
+        if instance is not None:
+            alias = _instance_shard(instance)
+            if alias:
+                return alias
+        return active_shard()
+
+    db_for_read = _db_for_model
+    db_for_write = _db_for_model
+
+    def allow_relation(self, obj1, obj2, **hints):
+        if not settings.SHARDS:
+            return None
+        if is_sharded(obj1) and is_sharded(obj2):
+            return obj1._state.db == obj2._state.db
+        # Patient.user, AuditLog.actor... : référence par id vers "default", sans contrainte en base
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if not settings.SHARDS or db == DEFAULT_DB_ALIAS or db not in settings.SHARDS.values():
+            return None
+        # Bases régionales : tables partitionnées, et User avec ses dépendances (auth, contenttypes)
+        # car 0001 crée Patient et Doctor avec une clé étrangère vers User ; ces tables restent vides
+        # (le routeur envoie User sur "default"). Pas de sessions ni de journal d'audit.
+        # RunPython de l'application sans hints={'model_name': ...} n'y est pas exécuté.
+        if app_label in SHARD_DEPENDENCY_APPS:
+            return True
+        return app_label == 'utilisateur' and model_name in SHARDED_MODELS | {'user'}
+
+
+class RegionMiddleware:
+    """Les requêtes d'une vue vont dans la base de la région de l'utilisateur connecté."""
+
+    def __init__(self, get_response):
+        if not settings.SHARDS:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        token = _active.set(lambda: shard_for_user(request.user))
+        try:
+            return self.get_response(request)
+        finally:
+            _active.reset(token)
+
+
+def on_each_shard(func, aliases=None):
+    """Appelle func(alias) pour chaque base, en parallèle ; retourne {alias: résultat}."""
+    aliases = aliases or shard_aliases()
+    if len(aliases) == 1:
+        return {aliases[0]: func(aliases[0])}
+
+    def run(alias):
+        try:
+            return func(alias)
+        finally:
+            connections.close_all()  # Connexions propres à ce thread
+
+    with ThreadPoolExecutor(max_workers=len(aliases)) as pool:
+        return dict(zip(aliases, pool.map(run, aliases)))
+
+
+def _field_value(row, name):
+    return row[name] if isinstance(row, dict) else getattr(row, name)
+
+
+def sort_key(ordering):
+    fields = [(name.lstrip('-'), name.startswith('-')) for name in ordering]
+
+    def compare(a, b):
+        for name, descending in fields:
+            x, y = _field_value(a, name), _field_value(b, name)
+            if x != y:
+                result = -1 if x < y else 1
+                return -result if descending else result
+        return 0
+
+    return functools.cmp_to_key(compare)
+
+
+def fan_out(queryset, ordering, limit=None, offset=0):
+    """
+    Exécute `queryset` (objets ou values()) sur toutes les bases et fusionne les lignes
+    selon `ordering`, ex. ['-date', '-id']. Chaque base ne renvoie que ses
+    offset + limit premières lignes : les pages suivantes coûtent plus cher.
+    """
+    queryset = queryset.order_by(*ordering)
+    if limit is not None:
+        queryset = queryset[:offset + limit]
+    batches = on_each_shard(lambda alias: list(queryset.using(alias)))
+    merged = heapq.merge(*batches.values(), key=sort_key(ordering))
+    return list(itertools.islice(merged, offset, None if limit is None else offset + limit))
+
+
+def fan_out_count(queryset):
+    return sum(on_each_shard(lambda alias: queryset.using(alias).count()).values())
+
+
+def reserve_id_range(using=DEFAULT_DB_ALIAS, **kwargs):
+    """post_migrate : les séquences des consultations et de la salle d'attente de `using` démarrent au début de sa plage."""
+    start = id_range_start(using)
+    if not start:
+        return
+    from .models import Consultation, WaitingRoomEntry
+
+    connection = connections[using]
+    for model in (Consultation, WaitingRoomEntry):
+        if (model.objects.using(using).aggregate(last=Max('id'))['last'] or 0) >= start:
+            continue
+        table = model._meta.db_table
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                cursor.execute("SELECT setval(pg_get_serial_sequence(%s, 'id'), %s)", [table, start])
+            elif connection.vendor == 'sqlite':
+                cursor.execute("DELETE FROM sqlite_sequence WHERE name = %s", [table])
+                cursor.execute("INSERT INTO sqlite_sequence (name, seq) VALUES (%s, %s)", [table, start])
+            elif connection.vendor == 'mysql':
+                cursor.execute(f"ALTER TABLE {connection.ops.quote_name(table)} AUTO_INCREMENT = {start + 1}")
+
+
+def _legacy_models():
+    return [apps.get_model('utilisateur', name) for name in LEGACY_MOVE_ORDER]
+
+
+def legacy_row_counts():
+    """Lignes partitionnées restées sur "default" (créées avant DATABASE_SHARDS), par modèle."""
+    if DEFAULT_DB_ALIAS in shard_aliases():
+        return {}
+    counts = {model._meta.model_name: model.objects.using(DEFAULT_DB_ALIAS).count() for model in _legacy_models()}
+    return {name: count for name, count in counts.items() if count}
+
+
+def misplaced_legacy_users():
+    """Comptes ayant des données sur "default" mais dont la région désigne une autre base que DEFAULT_REGION."""
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+    target = shard_for_region(settings.DEFAULT_REGION)
+    owners = set()
+    for name in ('Patient', 'Doctor'):
+        owners.update(apps.get_model('utilisateur', name).objects.using(DEFAULT_DB_ALIAS).values_list('pk', flat=True))
+    regions = User.objects.filter(pk__in=owners).values_list('username', 'region')
+    return sorted(username for username, region in regions if shard_for_region(region) != target)
+
+
+def move_legacy_rows(batch_size=1000):
+    """
+    Déplace les lignes partitionnées de "default" vers la base de DEFAULT_REGION, celle où
+    shard_for_consultation_id() cherche les ids antérieurs au partitionnement (ids conservés).
+    Copie par lots dans l'ordre des clés étrangères, puis suppression sur "default", dans l'ordre
+    inverse, des seules lignes présentes dans la base cible : la commande peut être relancée.
+    Retourne {modèle: lignes déplacées}.
+    """
+    target = shard_for_region(settings.DEFAULT_REGION)
+    models = _legacy_models()
+    for model in models:
+        queryset = model.objects.using(DEFAULT_DB_ALIAS).order_by('pk')
+        last = None
+        while True:
+            batch = list((queryset if last is None else queryset.filter(pk__gt=last))[:batch_size])
+            if not batch:
+                break
+            last = batch[-1].pk
+            # Sans save() : ni salle vidéo allouée, ni journal d'audit pour un simple déplacement
+            model.objects.using(target).bulk_create(batch, ignore_conflicts=True)
+    moved = {}
+    for model in reversed(models):
+        queryset = model.objects.using(DEFAULT_DB_ALIAS).order_by('pk')
+        moved[model._meta.model_name] = 0
+        last = None
+        while True:
+            pks = list((queryset if last is None else queryset.filter(pk__gt=last)).values_list('pk', flat=True)[:batch_size])
+            if not pks:
+                break
+            last = pks[-1]
+            copied = list(model.objects.using(target).filter(pk__in=pks).values_list('pk', flat=True))
+            model.objects.using(DEFAULT_DB_ALIAS).filter(pk__in=copied).delete()
+            moved[model._meta.model_name] += len(copied)
+    return moved
@@ -0,0 +1,77 @@
+"""
+Synchronisation des champs d'affichage dénormalisés de Consultation / ArchivedConsultation
+(patient_name, doctor_name, doctor_specialty) quand un User ou un Doctor est modifié.
+Les consultations sont dans la base de la région de l'utilisateur (utilisateur/sharding.py).
+"""
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import User, Patient, Doctor, Consultation, ArchivedConsultation
+from .sharding import shard_aliases, shard_for_user
+
+DENORMALIZED_MODELS = (Consultation, ArchivedConsultation)
+
+
+@receiver(post_save, sender=User, dispatch_uid='sync_user_display_names')
+def sync_user_display_names(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    # Les connexions (update_fields=['last_login']) ne déclenchent aucune requête
+    if created or raw or (update_fields is not None and 'username' not in update_fields):
+        return
+    using = shard_for_user(instance)
+    for model in DENORMALIZED_MODELS:
+        if instance.is_patient:
+            model.objects.using(using).filter(patient_id=instance.pk).exclude(
+                patient_name=instance.username).update(patient_name=instance.username)
+        if instance.is_doctor:
+            model.objects.using(using).filter(doctor_id=instance.pk).exclude(
+                doctor_name=instance.username).update(doctor_name=instance.username)
+
+
+@receiver(post_save, sender=Doctor, dispatch_uid='sync_doctor_specialty')
+def sync_doctor_specialty(sender, instance, created, raw=False, using=None, **kwargs):
+    if created or raw:
+        return
+    for model in DENORMALIZED_MODELS:
+        model.objects.using(using).filter(doctor_id=instance.pk).exclude(
+            doctor_specialty=instance.specialty).update(doctor_specialty=instance.specialty)
+
+
+@receiver(post_delete, sender=User, dispatch_uid='delete_regional_profiles')
+def delete_regional_profiles(sender, instance, **kwargs):
+    # La cascade de Django reste dans la base du User : les profils régionaux sont supprimés ici
+    if not settings.SHARDS:
+        return
+    using = shard_for_user(instance)
+    for model in (Patient, Doctor):
+        model.objects.using(using).filter(pk=instance.pk).delete()
+
+
+def resync_display_names(batch_size=5000):
+    """
+    Recalcule les champs de toutes les lignes, base par base et par tranches d'id.
+    Les noms sont lus sur la table User (base "default") : aucune jointure entre bases.
+    Retourne le nombre de lignes corrigées.
+    """
+    fields = ['patient_name', 'doctor_name', 'doctor_specialty']
+    total = 0
+    for using in shard_aliases():
+        for model in DENORMALIZED_MODELS:
+            queryset = model.objects.using(using).order_by('id')
+            last_id = 0
+            while True:
+                rows = list(queryset.filter(id__gt=last_id).values_list('id', 'patient_id', 'doctor_id', *fields)[:batch_size])
+                if not rows:
+                    break
+                last_id = rows[-1][0]
+                doctor_ids = {row[2] for row in rows}
+                names = dict(User.objects.filter(pk__in=doctor_ids | {row[1] for row in rows}).values_list('pk', 'username'))
+                specialties = dict(Doctor.objects.using(using).filter(pk__in=doctor_ids).values_list('pk', 'specialty'))
+                stale = []
+                for pk, patient_id, doctor_id, *current in rows:
+                    expected = [names.get(patient_id, ''), names.get(doctor_id, ''), specialties.get(doctor_id, '')]
+                    if current != expected:
+                        stale.append(model(id=pk, **dict(zip(fields, expected))))
+                model.objects.using(using).bulk_update(stale, fields)
+                total += len(stale)
+    return total
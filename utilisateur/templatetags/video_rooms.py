@@ -0,0 +1,15 @@
+from django import template
+from django.urls import reverse
+
+from utilisateur.rooms import make_join_token
+
+register = template.Library()
+
+
+@register.simple_tag(takes_context=True)
+def join_url(context, consultation):
+    """Lien signé vers la salle de la consultation pour l'utilisateur courant."""
+    if not consultation.video_link:
+        return ''
+    token = make_join_token(consultation.id, context['user'].pk, consultation.video_link)
+    return reverse('utilisateur:join_consultation', args=[token])
@@ -0,0 +1,73 @@
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from utilisateur.ratelimit import LocalCounterStore, SlidingWindowLimiter, get_client_ip
+
+
+class BrokenStore:
+    """Cache partagé indisponible."""
+
+    def get_many(self, keys):
+        raise ConnectionError("cache indisponible")
+
+    def incr(self, key, ttl):
+        raise ConnectionError("cache indisponible")
+
+
+class SlidingWindowLimiterTests(SimpleTestCase):
+    def limiter(self, store=None, fallback=None):
+        return SlidingWindowLimiter('test', 3, 60, store=store or LocalCounterStore(), fallback=fallback or LocalCounterStore())
+
+    def test_limit_boundary(self):
+        limiter = self.limiter()
+        self.assertEqual([limiter.hit('ip:1', now=120.0) for _ in range(3)], [True, True, True])
+        self.assertFalse(limiter.hit('ip:1', now=120.0))
+        self.assertTrue(limiter.hit('ip:2', now=120.0))  # Compteur propre à chaque clé
+
+    def test_previous_window_weight(self):
+        limiter = self.limiter()
+        for _ in range(3):
+            limiter.hit('ip:1', now=120.0)
+        # À mi-fenêtre suivante, la fenêtre précédente compte pour moitié : 1.5 + 1 puis 1.5 + 2
+        self.assertTrue(limiter.hit('ip:1', now=210.0))
+        self.assertFalse(limiter.hit('ip:1', now=210.0))
+        # Deux fenêtres plus tard, tout est oublié
+        self.assertTrue(limiter.hit('ip:1', now=300.0))
+
+    def test_local_fallback_when_cache_fails(self):
+        fallback = LocalCounterStore()
+        limiter = self.limiter(store=BrokenStore(), fallback=fallback)
+        self.assertEqual([limiter.hit('ip:1', now=120.0) for _ in range(3)], [True, True, True])
+        self.assertFalse(limiter.hit('ip:1', now=120.0))
+        self.assertTrue(fallback.get_many([limiter._keys('ip:1', 120.0)[0]]))
+
+
+class ClientIpTests(SimpleTestCase):
+    factory = RequestFactory()
+
+    def ip(self, forwarded=None):
+        headers = {'HTTP_X_FORWARDED_FOR': forwarded} if forwarded is not None else {}
+        return get_client_ip(self.factory.get('/', REMOTE_ADDR='10.0.0.2', **headers))
+
+    @override_settings(RATELIMIT_TRUSTED_PROXIES=0)
+    def test_no_proxy_ignores_header(self):
+        self.assertEqual(self.ip('203.0.113.7'), '10.0.0.2')
+
+    @override_settings(RATELIMIT_TRUSTED_PROXIES=1)
+    def test_one_proxy(self):
+        self.assertEqual(self.ip('203.0.113.7'), '203.0.113.7')
+        self.assertEqual(self.ip(), '10.0.0.2')  # Requête qui n'est pas passée par le proxy
+
+    @override_settings(RATELIMIT_TRUSTED_PROXIES=2)
+    def test_two_proxies(self):
+        self.assertEqual(self.ip('203.0.113.7, 10.0.0.1'), '203.0.113.7')
+        self.assertEqual(self.ip('10.0.0.1'), '10.0.0.2')  # Trop peu d'entrées : REMOTE_ADDR
+
+    @override_settings(RATELIMIT_TRUSTED_PROXIES=1)
+    def test_spoofed_entries_are_ignored(self):
+        # Les entrées ajoutées par le client sont à gauche : changer leur valeur ne change pas l'IP comptée
+        self.assertEqual(self.ip('1.2.3.4, 5.6.7.8, 203.0.113.7'), '203.0.113.7')
+        self.assertEqual(self.ip('9.9.9.9, 203.0.113.7'), '203.0.113.7')
+
+    @override_settings(RATELIMIT_TRUSTED_PROXIES=2)
+    def test_spoofed_entries_two_proxies(self):
+        self.assertEqual(self.ip('1.2.3.4, 5.6.7.8, 203.0.113.7, 10.0.0.1'), '203.0.113.7')
@@ -0,0 +1,34 @@
+import io
+
+from django.test import SimpleTestCase
+
+from utilisateur.reconciliation import InvalidLine, iter_json_array
+
+
+class IterJsonArrayTests(SimpleTestCase):
+    def read(self, text, chunk_size=65536):
+        return [
+            (number, 'invalide' if isinstance(entry, InvalidLine) else entry)
+            for number, entry in iter_json_array(io.StringIO(text), chunk_size)
+        ]
+
+    def assertReads(self, text, expected):
+        # Même résultat quel que soit le découpage des blocs
+        for chunk_size in (1, 3, 7, 65536):
+            self.assertEqual(self.read(text, chunk_size), expected)
+
+    def test_valid_elements(self):
+        self.assertReads('[{"a": 1}, 42, "x,]", {"b": [1, {"c": "]"}]}]', [
+            (1, {'a': 1}), (2, 42), (3, 'x,]'), (4, {'b': [1, {'c': ']'}]}),
+        ])
+
+    def test_each_invalid_element_is_reported(self):
+        self.assertReads('[{"a": 1}, tru, {bad}, , [1, x], {"c": 3}]', [
+            (1, {'a': 1}), (2, 'invalide'), (3, 'invalide'), (4, 'invalide'), (5, 'invalide'), (6, {'c': 3}),
+        ])
+
+    def test_trailing_garbage_invalidates_element(self):
+        self.assertReads('[{"a": 1} x, {"s": "a\\\\\\"b,]"}]', [(1, 'invalide'), (2, {'s': 'a\\"b,]'})])
+
+    def test_truncated_array(self):
+        self.assertReads('[{"a": 1}, {"b":', [(1, {'a': 1}), (2, 'invalide')])
@@ -0,0 +1,84 @@
+import time
+from io import StringIO
+from datetime import timedelta
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from utilisateur.models import User, Patient, Doctor, Consultation
+from utilisateur.rooms import get_provider, make_join_token, reset_pool
+
+
+@override_settings(VIDEO_ROOM_PROVIDER='utilisateur.rooms.LocalRoomProvider', VIDEO_ROOM_POOL_SIZE=3)
+class VideoRoomTests(TestCase):
+    def setUp(self):
+        reset_pool()
+        self.addCleanup(reset_pool)
+        self.patient_user = User.objects.create_user('patient', password='x', is_patient=True)
+        self.patient = Patient.objects.create(user=self.patient_user)
+        self.doctor_user = User.objects.create_user('docteur', password='x', is_doctor=True)
+        self.doctor = Doctor.objects.create(user=self.doctor_user, specialty='Cardiologie')
+
+    def create_consultation(self, days=1):
+        return Consultation.objects.create(
+            patient=self.patient, doctor=self.doctor, date=timezone.now() + timedelta(days=days),
+        )
+
+    def join(self, consultation, user):
+        return reverse('utilisateur:join_consultation', args=[
+            make_join_token(consultation.pk, user.pk, consultation.video_link),
+        ])
+
+    def test_room_allocated_from_pool(self):
+        first = self.create_consultation(days=1)
+        second = self.create_consultation(days=2)
+        provider = get_provider()
+        self.assertTrue(first.video_link.startswith(provider.base_url))
+        self.assertNotEqual(first.video_link, second.video_link)
+        self.assertEqual(len(provider.created), 3)  # Un seul lot pour les deux consultations
+
+    def test_room_released_on_completion(self):
+        consultation = self.create_consultation()
+        room_id = get_provider().room_id(consultation.video_link)
+        consultation.status = 'completed'
+        consultation.save(update_fields=['status'])
+        self.assertIsNone(Consultation.objects.get(pk=consultation.pk).video_link)
+        self.assertEqual(get_provider().closed, [room_id])
+
+    def test_join_redirects_owner_to_room(self):
+        consultation = self.create_consultation()
+        self.client.force_login(self.patient_user)
+        response = self.client.get(self.join(consultation, self.patient_user))
+        self.assertRedirects(response, consultation.video_link, fetch_redirect_response=False)
+
+    def test_join_requires_login(self):
+        url = self.join(self.create_consultation(), self.patient_user)
+        response = self.client.get(url)
+        self.assertRedirects(response, f"{reverse('utilisateur:login')}?next={url}", fetch_redirect_response=False)
+
+    def test_join_rejects_other_user(self):
+        consultation = self.create_consultation()
+        self.client.force_login(self.doctor_user)
+        response = self.client.get(self.join(consultation, self.patient_user))
+        self.assertEqual(response.status_code, 403)
+
+    @override_settings(VIDEO_JOIN_TOKEN_MAX_AGE=60)
+    def test_join_rejects_expired_token(self):
+        consultation = self.create_consultation()
+        with mock.patch('django.core.signing.time.time', return_value=time.time() - 120):
+            url = self.join(consultation, self.patient_user)
+        self.client.force_login(self.patient_user)
+        response = self.client.get(url)
+        self.assertRedirects(response, reverse('utilisateur:login'), fetch_redirect_response=False)
+
+    def test_expire_video_rooms(self):
+        consultation = self.create_consultation()
+        room_id = get_provider().room_id(consultation.video_link)
+        # Donnée antérieure au cycle de vie : terminée mais lien encore présent
+        Consultation.objects.filter(pk=consultation.pk).update(status='completed')
+        call_command('expire_video_rooms', stdout=StringIO())
+        self.assertIsNone(Consultation.objects.get(pk=consultation.pk).video_link)
+        self.assertIn(room_id, get_provider().closed)
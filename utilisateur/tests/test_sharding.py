@@ -0,0 +1,104 @@
+from datetime import timedelta
+from unittest import skipUnless
+
+from django.conf import settings
+from django.db import connections
+from django.test import TestCase, TransactionTestCase
+from django.utils import timezone
+
+from utilisateur.models import User, Patient, Doctor, Consultation
+from utilisateur.sharding import (
+    ID_RANGE_BITS, RegionRouter, fan_out, id_range_start, move_legacy_rows, shard_for_consultation_id, shard_for_user,
+    use_region,
+)
+
+
+SHARDS_CONFIGURED = skipUnless(
+    {'eu': 'shard_eu', 'af': 'shard_af'}.items() <= settings.SHARDS.items() and settings.DEFAULT_REGION == 'eu',
+    "DATABASE_SHARDS doit définir les régions eu et af (eu par défaut).",
+)
+
+SHARD_DATABASES = {'default', *settings.SHARDS.values()}  # Sans DATABASE_SHARDS : classes ignorées
+
+
+class ShardedDataMixin:
+    # Comme les vues : profils créés dans la base de la région, consultations enregistrées par save()
+    def create_pair(self, region):
+        patient_user = User.objects.create_user(f'patient_{region}', password='x', is_patient=True, region=region)
+        doctor_user = User.objects.create_user(f'docteur_{region}', password='x', is_doctor=True, region=region)
+        patient = Patient.objects.db_manager(shard_for_user(patient_user)).create(user=patient_user)
+        doctor = Doctor.objects.db_manager(shard_for_user(doctor_user)).create(user=doctor_user, specialty='Cardiologie')
+        return patient, doctor
+
+    def create_consultation(self, patient, doctor, hours):
+        consultation = Consultation(patient=patient, doctor=doctor, date=timezone.now() + timedelta(hours=hours))
+        consultation.save()
+        return consultation
+
+
+# Lancés avec DATABASE_SHARDS="eu=sqlite:///shard_eu.sqlite3,af=sqlite:///shard_af.sqlite3"
+@SHARDS_CONFIGURED
+class ShardingTests(ShardedDataMixin, TestCase):
+    databases = SHARD_DATABASES
+
+    def test_rows_follow_user_region(self):
+        patient, doctor = self.create_pair('af')
+        consultation = self.create_consultation(patient, doctor, 1)
+        self.assertEqual((patient._state.db, doctor._state.db, consultation._state.db), ('shard_af',) * 3)
+        self.assertFalse(Patient.objects.using('default').exists())
+        self.assertFalse(User.objects.using('shard_af').exists())  # Table présente mais vide
+        with use_region('af'):
+            self.assertEqual(list(Consultation.objects.values_list('pk', flat=True)), [consultation.pk])
+        self.assertFalse(Consultation.objects.exists())  # Hors région active : DEFAULT_REGION
+
+    def test_consultation_id_gives_shard(self):
+        eu = self.create_consultation(*self.create_pair('eu'), 1)
+        af = self.create_consultation(*self.create_pair('af'), 1)
+        self.assertEqual(eu.pk >> ID_RANGE_BITS, 1)
+        self.assertGreaterEqual(af.pk, id_range_start('shard_af'))
+        self.assertEqual(shard_for_consultation_id(eu.pk), 'shard_eu')
+        self.assertEqual(shard_for_consultation_id(af.pk), 'shard_af')
+        self.assertEqual(shard_for_consultation_id(42), 'shard_eu')  # Id d'avant le partitionnement : DEFAULT_REGION
+
+    def test_allow_migrate(self):
+        router = RegionRouter()
+        self.assertIsNone(router.allow_migrate('default', 'sessions', 'session'))
+        self.assertTrue(router.allow_migrate('shard_eu', 'utilisateur', 'consultation'))
+        self.assertTrue(router.allow_migrate('shard_eu', 'utilisateur', 'user'))  # Cible de Patient.user dans 0001
+        self.assertTrue(router.allow_migrate('shard_eu', 'auth', 'group'))
+        self.assertFalse(router.allow_migrate('shard_eu', 'utilisateur', 'auditlog'))
+        self.assertFalse(router.allow_migrate('shard_eu', 'sessions', 'session'))
+        self.assertFalse(router.allow_migrate('shard_eu', 'utilisateur', None))  # RunPython sans hints
+        tables = connections['shard_af'].introspection.table_names()
+        self.assertIn('utilisateur_consultation', tables)
+        self.assertNotIn('utilisateur_auditlog', tables)
+        self.assertNotIn('django_session', tables)
+
+    def test_move_legacy_rows(self):
+        patient_user = User.objects.create_user('ancien', password='x', is_patient=True)
+        doctor_user = User.objects.create_user('ancien_docteur', password='x', is_doctor=True)
+        # Données créées sur "default" avant DATABASE_SHARDS
+        patient = Patient.objects.using('default').create(user=patient_user)
+        doctor = Doctor.objects.using('default').create(user=doctor_user, specialty='Cardiologie')
+        consultation = Consultation.objects.using('default').create(patient=patient, doctor=doctor, date=timezone.now())
+        moved = move_legacy_rows(batch_size=1)
+        self.assertEqual((moved['patient'], moved['doctor'], moved['consultation']), (1, 1, 1))
+        self.assertFalse(Consultation.objects.using('default').exists())
+        self.assertEqual(Consultation.objects.get(pk=consultation.pk).patient_id, patient_user.pk)
+        self.assertEqual(move_legacy_rows()['consultation'], 0)  # Relançable
+
+
+# fan_out() interroge les bases depuis des threads : données validées, pas de transaction de test
+@SHARDS_CONFIGURED
+class FanOutTests(ShardedDataMixin, TransactionTestCase):
+    databases = SHARD_DATABASES
+
+    def test_fan_out_merges_by_ordering(self):
+        eu_pair, af_pair = self.create_pair('eu'), self.create_pair('af')
+        expected = []
+        for hours, pair in [(1, eu_pair), (2, af_pair), (3, eu_pair), (4, af_pair), (5, af_pair)]:
+            expected.append(self.create_consultation(*pair, hours).pk)
+        expected.reverse()
+        queryset = Consultation.objects.values('id', 'date')
+        self.assertEqual([row['id'] for row in fan_out(queryset, ['-date', '-id'])], expected)
+        self.assertEqual([row['id'] for row in fan_out(queryset, ['-date', '-id'], limit=2, offset=1)], expected[1:3])
@@ -0,0 +1,71 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from utilisateur.models import User, Patient, Doctor, Consultation, WaitingRoomEntry
+from utilisateur.waiting_room import get_waiting_room, reset_waiting_rooms
+
+
+class DeleteAccountWithConsultationsTests(TestCase):
+    # WaitingRoomEntry.consultation (SET_NULL) empêche la suppression rapide : le Collector
+    # charge les consultations avec only(), qui ne doit pas relancer le journal d'audit en boucle
+
+    def setUp(self):
+        reset_waiting_rooms()
+        self.patient_user = User.objects.create_user('patient', password='x', is_patient=True)
+        self.patient = Patient.objects.create(user=self.patient_user)
+        self.doctor_user = User.objects.create_user('docteur', password='x', is_doctor=True)
+        self.doctor = Doctor.objects.create(user=self.doctor_user, specialty='Cardiologie')
+        self.scheduled = Consultation.objects.create(
+            patient=self.patient, doctor=self.doctor, date=timezone.now() + timedelta(days=1),
+        )
+        room = get_waiting_room()
+        self.entry = room.enqueue(self.patient, self.doctor.specialty)
+        self.walk_in = room.next_patient(self.doctor.pk, self.doctor.specialty)
+
+    def test_deferred_load(self):
+        consultation = Consultation.objects.only('id').get(pk=self.scheduled.pk)
+        self.assertEqual(consultation.status, 'pending')
+
+    def test_delete_patient(self):
+        self.patient_user.delete()
+        self.assertFalse(Consultation.objects.filter(pk__in=[self.scheduled.pk, self.walk_in.pk]).exists())
+        self.assertFalse(WaitingRoomEntry.objects.filter(pk=self.entry.pk).exists())
+
+    def test_delete_doctor(self):
+        self.doctor_user.delete()
+        self.assertFalse(Consultation.objects.filter(doctor_id=self.doctor.pk).exists())
+        self.assertIsNone(WaitingRoomEntry.objects.get(pk=self.entry.pk).consultation_id)
+
+
+class WaitingRoomPriorityTests(TestCase):
+    def setUp(self):
+        reset_waiting_rooms()
+        self.addCleanup(reset_waiting_rooms)
+        self.doctor_user = User.objects.create_user('docteur', password='x', is_doctor=True)
+        self.doctor = Doctor.objects.create(user=self.doctor_user, specialty='Cardiologie')
+        self.patients = []
+        for name in ('premier', 'second'):
+            user = User.objects.create_user(name, password='x', is_patient=True)
+            self.patients.append(Patient.objects.create(user=user))
+
+    def test_patient_cannot_choose_priority(self):
+        self.client.force_login(self.patients[0].user)
+        self.client.post(reverse('utilisateur:waiting_room'), {'specialty': 'Cardiologie', 'priority': 0})
+        self.assertEqual(WaitingRoomEntry.objects.get(patient=self.patients[0]).priority, 1)
+
+    def test_staff_marks_entry_urgent(self):
+        room = get_waiting_room()
+        room.enqueue(self.patients[0], 'Cardiologie')
+        second = room.enqueue(self.patients[1], 'Cardiologie')
+        staff = User.objects.create_superuser('admin', password='x')
+        self.client.force_login(staff)
+        self.client.post(reverse('admin:utilisateur_waitingroomentry_changelist'), {
+            'action': 'mark_urgent', '_selected_action': [second.pk],
+        })
+        self.assertEqual(WaitingRoomEntry.objects.get(pk=second.pk).priority, 0)
+        self.assertEqual(room.status(second.pk)[0], 0)  # Passé devant dans la file en mémoire
+        consultation = room.next_patient(self.doctor.pk, self.doctor.specialty)
+        self.assertEqual(consultation.patient_id, self.patients[1].pk)
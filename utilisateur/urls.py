@@ -3,8 +3,10 @@ from .views import (
     CustomLoginView, register_patient, register_doctor, custom_logout,
     patient_dashboard, doctor_dashboard, ConsultationCreateView,
     CustomPasswordResetView, CustomPasswordResetDoneView, CustomPasswordResetConfirmView,
-    CustomPasswordResetCompleteView, about_us, update_consultation_status
+    CustomPasswordResetCompleteView, about_us, update_consultation_status, consultation_history,
+    join_consultation, waiting_room, waiting_room_next
 )
+from . import api
 
 app_name = 'utilisateur'
 
@@ -21,8 +23,16 @@ urlpatterns = [
     path('doctor/dashboard/', doctor_dashboard, name='doctor_dashboard'),
     path("consultations/<int:consultation_id>/status/<str:status>/", update_consultation_status, name="update_consultation_status"),
     # path('consultations/', ConsultationListView.as_view(), name='consultation_list'),
+    path('consultations/history/', consultation_history, name='consultation_history'),
+    path('consultations/join/<str:token>/', join_consultation, name='join_consultation'),
     path('consultations/create/', ConsultationCreateView.as_view(), name='consultation_create'),
+    path('waiting-room/', waiting_room, name='waiting_room'),
+    path('waiting-room/next/', waiting_room_next, name='waiting_room_next'),
     path('about-us/', about_us, name='about_us'),
+    # API JSON (client mobile)
+    path('api/v1/consultations/', api.consultation_list, name='api_consultation_list'),
+    path('api/v1/consultations/<int:consultation_id>/', api.consultation_detail, name='api_consultation_detail'),
+    path('api/v1/consultations/<int:consultation_id>/status/', api.consultation_status, name='api_consultation_status'),
 ]
 # from django.urls import path
 # from .views import (about_us, CustomLoginView, register_patient, register_doctor, custom_logout,
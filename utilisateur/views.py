@@ -3,17 +3,26 @@ from django.contrib.auth import login, authenticate, logout
 from django.contrib.auth.views import LoginView, PasswordResetView, PasswordResetDoneView, PasswordResetConfirmView, PasswordResetCompleteView
 # from django.contrib.auth.forms import AuthenticationForm
 from django.contrib.auth.decorators import login_required
-from django.http import HttpResponseForbidden
+from django.http import HttpResponseBadRequest, HttpResponseForbidden
 from django.contrib import messages
 from django.urls import reverse_lazy
-from .forms import PatientRegistrationForm, DoctorRegistrationForm, ConsultationForm, CustomAuthenticationForm, CustomPasswordResetForm
-from .models import User, Patient, Doctor, Consultation
+from .forms import PatientRegistrationForm, DoctorRegistrationForm, ConsultationForm, CustomAuthenticationForm, CustomPasswordResetForm, WaitingRoomForm
+from .models import User, Patient, Doctor, Consultation, WaitingRoomEntry, STATUS_CHOICES
 from django.views.generic import ListView, CreateView
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.auth import get_user_model
 from django.core.mail import EmailMultiAlternatives
 from django.template.loader import render_to_string
 from django.utils.html import strip_tags
+from django.utils.decorators import method_decorator
+from django.core.paginator import Paginator
+from .ratelimit import ratelimit
+from .archive import all_consultations
+from .rooms import verify_join_token
+from .sharding import shard_for_user
+from .waiting_room import get_waiting_room
+from django.views.decorators.http import require_POST
+from django.contrib.auth import SESSION_KEY
 
 User = get_user_model()
 
@@ -22,6 +31,7 @@ def about_us(request):
     return render(request, 'idea/about-us.html')
 
 # Vue personnalisée pour la connexion
+@method_decorator(ratelimit('login'), name='dispatch')
 class CustomLoginView(LoginView):
     template_name = 'idea/login.html'  # Ton template basé sur base.html
     form_class = CustomAuthenticationForm
@@ -71,6 +81,7 @@ class CustomLoginView(LoginView):
 
 
 # Vues pour l'inscription
+@ratelimit('register')
 def register_patient(request):
     if request.method == 'POST':
         form = PatientRegistrationForm(request.POST)
@@ -81,8 +92,8 @@ def register_patient(request):
             print('============= verif register patient ========== ')
 
 
-            # Créer le profil Patient lié à l'utilisateur
-            Patient.objects.create(
+            # Créer le profil Patient lié à l'utilisateur, dans la base de sa région
+            Patient.objects.db_manager(shard_for_user(user)).create(
                 user=user,
                 phone_number=form.cleaned_data['phone_number'],
                 address=form.cleaned_data['address']
@@ -97,6 +108,7 @@ def register_patient(request):
     return render(request, 'idea/register_patient.html', {'form': form})
 
 
+@ratelimit('register')
 def register_doctor(request):
     if request.method == 'POST':
         form = DoctorRegistrationForm(request.POST)
@@ -104,7 +116,7 @@ def register_doctor(request):
             user = form.save(commit=False)
             user.is_doctor = True
             user.save()
-            Doctor.objects.create(user=user, specialty=form.cleaned_data['specialty'], license_number=form.cleaned_data['license_number'])
+            Doctor.objects.db_manager(shard_for_user(user)).create(user=user, specialty=form.cleaned_data['specialty'], license_number=form.cleaned_data['license_number'])
             messages.success(request, "Inscription réussie ! Veuillez vous connecter.")
             return redirect('utilisateur:login')
     else:
@@ -123,7 +135,7 @@ def patient_dashboard(request):
     if not request.user.is_patient:
         messages.error(request, "Vous n'êtes pas autorisé à accéder à cette page.")
         return redirect('utilisateur:login')
-    consultations = Consultation.objects.filter(patient__user=request.user)
+    consultations = Consultation.objects.filter(patient_id=request.user.pk)
     return render(request, 'idea/patient_dashboard.html', {'consultations': consultations})
 
 # Tableau de bord médecin
@@ -132,23 +144,99 @@ def doctor_dashboard(request):
     if not request.user.is_doctor:
         messages.error(request, "Vous n'êtes pas autorisé à accéder à cette page.")
         return redirect('utilisateur:login')
-    consultations = Consultation.objects.filter(doctor__user=request.user).order_by("-date")
-    return render(request, 'idea/doctor_dashboard.html', {'consultations': consultations})
+    consultations = Consultation.objects.filter(doctor_id=request.user.pk).order_by("-date")
+    waiting = get_waiting_room().waiting_count(request.user.doctor.specialty)
+    return render(request, 'idea/doctor_dashboard.html', {'consultations': consultations, 'waiting': waiting})
 
+# Salle d'attente : consultation sans rendez-vous avec le premier médecin libre de la spécialité
 @login_required
+def waiting_room(request):
+    if not request.user.is_patient:
+        messages.error(request, "Vous n'êtes pas autorisé à accéder à cette page.")
+        return redirect('utilisateur:login')
+    room = get_waiting_room()
+    entry = WaitingRoomEntry.objects.filter(patient_id=request.user.pk).order_by('-id').first()
+    if request.method == 'POST':
+        if request.POST.get('action') == 'cancel':
+            if entry is not None and room.cancel(entry):
+                messages.success(request, "Vous avez quitté la salle d'attente.")
+        else:
+            form = WaitingRoomForm(request.POST)
+            if form.is_valid():
+                room.enqueue(request.user.patient, form.cleaned_data['specialty'])
+                messages.success(request, "Vous êtes en salle d'attente.")
+            else:
+                messages.error(request, "Veuillez choisir une spécialité valide.")
+        return redirect('utilisateur:waiting_room')
+    status = room.status(entry.pk) if entry is not None and entry.status == 'waiting' else None
+    return render(request, 'idea/waiting_room.html', {
+        'entry': entry,
+        'ahead': status[0] if status else None,
+        'wait_minutes': round(status[1] / 60) if status else None,
+        'form': WaitingRoomForm(),
+    })
+
+# Le médecin prend le patient suivant de la salle d'attente
+@login_required
+@require_POST
+def waiting_room_next(request):
+    if not request.user.is_doctor:
+        return HttpResponseForbidden("Réservé aux médecins.")
+    doctor = request.user.doctor
+    consultation = get_waiting_room().next_patient(doctor.pk, doctor.specialty)
+    if consultation is None:
+        messages.success(request, "Aucun patient en salle d'attente.")
+    else:
+        messages.success(request, f"Patient suivant : {consultation.patient_name}")
+    return redirect('utilisateur:doctor_dashboard')
+
+# Historique complet (consultations récentes + archivées)
+@login_required
+def consultation_history(request):
+    if request.user.is_patient:
+        consultations = all_consultations(patient_id=request.user.pk)
+    elif request.user.is_doctor:
+        consultations = all_consultations(doctor_id=request.user.pk)
+    else:
+        messages.error(request, "Vous n'êtes pas autorisé à accéder à cette page.")
+        return redirect('utilisateur:login')
+    page = Paginator(consultations, 50).get_page(request.GET.get('page'))
+    return render(request, 'idea/consultation_history.html', {'page': page})
+
+# Accès à la salle vidéo via un jeton signé : aucune requête sur les consultations
+@login_required
+def join_consultation(request, token):
+    payload = verify_join_token(token)
+    if payload is None:
+        messages.error(request, "Lien de consultation expiré ou invalide.")
+        return redirect('utilisateur:login')
+    if str(payload['u']) != request.session.get(SESSION_KEY):
+        return HttpResponseForbidden("Ce lien ne vous est pas destiné.")
+    return redirect(payload['r'])
+
+@login_required
+@require_POST  # Effets de bord (salle d'attente) : jamais sur un simple lien
 def update_consultation_status(request, consultation_id, status):
+    if status not in dict(STATUS_CHOICES):
+        return HttpResponseBadRequest("Statut invalide.")
     consultation = get_object_or_404(Consultation, id=consultation_id)
 
     # Vérification : seul le patient ou le médecin concerné peut agir
-    if not (request.user == consultation.patient.user or request.user == consultation.doctor.user):
+    if request.user.pk not in (consultation.patient_id, consultation.doctor_id):
         return HttpResponseForbidden("Vous n'êtes pas autorisé à modifier cette consultation.")
 
     # Mise à jour du statut
     consultation.status = status
     consultation.save()
 
+    # Médecin libéré : le patient suivant de la salle d'attente lui est attribué
+    if status == 'completed' and request.user.pk == consultation.doctor_id:
+        following = get_waiting_room().consultation_completed(consultation)
+        if following is not None:
+            messages.success(request, f"Patient suivant (salle d'attente) : {following.patient_name}")
+
     # Redirection selon le rôle
-    if hasattr(request.user, 'doctor'):
+    if request.user.is_doctor:
         return redirect('utilisateur:doctor_dashboard')
     else:
         return redirect('utilisateur:patient_dashboard')
@@ -173,9 +261,9 @@ class ConsultationListView(ListView):
 
     def get_queryset(self):
         if self.request.user.is_patient:
-            return Consultation.objects.filter(patient__user=self.request.user)
+            return Consultation.objects.filter(patient_id=self.request.user.pk)
         elif self.request.user.is_doctor:
-            return Consultation.objects.filter(doctor__user=self.request.user)
+            return Consultation.objects.filter(doctor_id=self.request.user.pk)
         return Consultation.objects.none()
 
 # Création d'une consultation
@@ -187,7 +275,7 @@ class ConsultationCreateView(CreateView):
 
     def form_valid(self, form):
         form.instance.patient = self.request.user.patient
-        form.instance.doctor = Doctor.objects.filter(user__is_doctor=True).first()  # À ajuster selon ta logique
+        form.instance.doctor = Doctor.objects.first()  # Base de la région du patient ; à ajuster selon ta logique
         messages.success(self.request, "Consultation créée avec succès !")
         return super().form_valid(form)
 
@@ -0,0 +1,268 @@
+"""
+Salle d'attente des consultations sans rendez-vous.
+
+- Une file de priorité en mémoire par spécialité et par base régionale : liste triée de
+  clés (-priorité, -id), la tête en fin de liste. Ajout par insort, retrait de la tête en
+  O(1), rang d'un patient en O(log n) (bisect).
+- Chaque entrée est écrite dans WaitingRoomEntry. Au démarrage (reprise après incident)
+  et toutes les WAITING_ROOM_RESYNC secondes, les files sont reconstruites depuis
+  l'index (status, enqueued_at) ; entre-temps seules les entrées arrivées depuis la
+  dernière lecture sont chargées (ajouts des autres workers, au plus une lecture toutes
+  les WAITING_ROOM_SYNC_INTERVAL secondes), avec un recouvrement de
+  WAITING_ROOM_SYNC_OVERLAP secondes pour les transactions validées en retard.
+- La prise en charge commence par un UPDATE conditionnel (status='waiting') : deux
+  workers ne peuvent pas attribuer le même patient, une entrée annulée ou prise ailleurs
+  est ignorée. Le verrou du processus ne protège que les files en mémoire, jamais une
+  requête SQL.
+- Quand un médecin termine une consultation, le patient suivant de sa spécialité lui est
+  attribué (nouvelle Consultation datée de maintenant).
+- Attente estimée : (rang + 1) / médecins actifs × durée moyenne mesurée d'une
+  consultation (moyenne mobile par processus, WAITING_ROOM_SERVICE_MINUTES au départ).
+"""
+import math
+import threading
+import time
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, router, transaction
+from django.utils import timezone
+
+from .models import Consultation, User, WaitingRoomEntry
+
+ACTIVE_DOCTOR_WINDOW = 3600  # Un médecin compte comme actif une heure après sa dernière prise en charge
+SERVICE_TIME_WEIGHT = 0.2  # Poids d'une nouvelle mesure dans la moyenne mobile
+MAX_SERVICE_TIME = 4 * 3600  # Au-delà, la mesure est ignorée (consultation oubliée « en cours »)
+
+
+def specialty_key(specialty):
+    return ' '.join(specialty.split()).lower()
+
+
+class WaitingQueue:
+    """File d'une spécialité : les plus urgents d'abord, puis par ordre d'arrivée (id)."""
+
+    def __init__(self):
+        self._keys = []
+
+    def push(self, entry_id, priority):
+        insort(self._keys, (-priority, -entry_id))
+
+    def pop(self):
+        return -self._keys.pop()[1]
+
+    def remove(self, entry_id, priority):
+        key = (-priority, -entry_id)
+        index = bisect_left(self._keys, key)
+        if index < len(self._keys) and self._keys[index] == key:
+            del self._keys[index]
+
+    def ahead(self, entry_id, priority):
+        """Nombre de patients servis avant cette entrée."""
+        return len(self._keys) - bisect_right(self._keys, (-priority, -entry_id))
+
+    def __len__(self):
+        return len(self._keys)
+
+
+class WaitingRoom:
+    """Files en mémoire d'une base, avec WaitingRoomEntry comme copie persistante."""
+
+    def __init__(self, using):
+        self.using = using
+        self.queues = defaultdict(WaitingQueue)
+        self.entries = {}  # id -> (spécialité, priorité, patient_id)
+        self.service_time = {}  # spécialité -> secondes
+        self.active_doctors = defaultdict(dict)  # spécialité -> {doctor_id: dernière prise en charge}
+        self._synced_at = None  # Heure de la dernière lecture (timezone.now())
+        self._loaded_at = None
+        self._polled_at = None  # time.monotonic() de la dernière lecture
+        self._lock = threading.RLock()
+
+    def _waiting(self):
+        return (
+            WaitingRoomEntry.objects.using(self.using).filter(status='waiting')
+            .values_list('id', 'specialty', 'priority', 'patient_id')
+        )
+
+    def _add(self, entry_id, specialty, priority, patient_id):
+        if entry_id not in self.entries:
+            self.entries[entry_id] = (specialty, priority, patient_id)
+            self.queues[specialty].push(entry_id, priority)
+
+    def load(self):
+        """Reconstruit les files depuis la base (démarrage, reprise après incident)."""
+        synced_at = timezone.now()
+        rows = list(self._waiting().iterator(chunk_size=5000))
+        with self._lock:
+            self.queues.clear()
+            self.entries.clear()
+            for row in rows:
+                self._add(*row)
+            self._synced_at = synced_at
+            self._loaded_at = self._polled_at = time.monotonic()
+
+    def sync(self, force=False):
+        now = time.monotonic()
+        if self._loaded_at is None or now - self._loaded_at > settings.WAITING_ROOM_RESYNC:
+            self.load()
+            return
+        if not force and now - self._polled_at < settings.WAITING_ROOM_SYNC_INTERVAL:
+            return
+        self._polled_at = now
+        # Relecture par date d'arrivée et non par id : une entrée d'id plus petit validée
+        # après la lecture précédente est retrouvée grâce au recouvrement
+        since = self._synced_at - timedelta(seconds=settings.WAITING_ROOM_SYNC_OVERLAP)
+        synced_at = timezone.now()
+        rows = list(self._waiting().filter(enqueued_at__gte=since))
+        with self._lock:
+            for row in rows:
+                self._add(*row)
+            self._synced_at = max(self._synced_at, synced_at)
+
+    def enqueue(self, patient, specialty, priority=1):
+        """Ajoute le patient à la file ; s'il attend déjà, retourne son entrée en cours."""
+        specialty = specialty_key(specialty)
+        try:
+            with transaction.atomic(using=self.using):
+                entry = WaitingRoomEntry.objects.using(self.using).create(
+                    patient=patient, specialty=specialty, priority=priority,
+                )
+        except IntegrityError:  # unique_waiting_patient
+            return WaitingRoomEntry.objects.using(self.using).get(patient=patient, status='waiting')
+
+        def add():
+            with self._lock:
+                self._add(entry.pk, specialty, priority, patient.pk)
+
+        transaction.on_commit(add, using=self.using)  # Immédiat hors transaction englobante
+        return entry
+
+    def cancel(self, entry):
+        updated = WaitingRoomEntry.objects.using(self.using).filter(pk=entry.pk, status='waiting').update(status='cancelled')
+        with self._lock:
+            item = self.entries.pop(entry.pk, None)
+            if item is not None:
+                self.queues[item[0]].remove(entry.pk, item[1])
+        return bool(updated)
+
+    def set_priority(self, entry_id, priority):
+        """
+        Change la priorité d'une entrée en attente (triage par le personnel) et la replace
+        dans la file. Les autres workers la voient au prochain rechargement complet.
+        """
+        updated = (
+            WaitingRoomEntry.objects.using(self.using).filter(pk=entry_id, status='waiting')
+            .update(priority=priority)
+        )
+        with self._lock:
+            item = self.entries.get(entry_id)
+            if item is not None and item[1] != priority:
+                self.queues[item[0]].remove(entry_id, item[1])
+                self.entries[entry_id] = (item[0], priority, item[2])
+                self.queues[item[0]].push(entry_id, priority)
+        return bool(updated)
+
+    def _claim(self, entry_id, patient_id, doctor_id, specialty):
+        now = timezone.now()
+        entries = WaitingRoomEntry.objects.using(self.using).filter(pk=entry_id)
+        with transaction.atomic(using=self.using):
+            # L'UPDATE conditionnel d'abord : il verrouille la ligne, un autre worker qui
+            # tente la même entrée attend puis ne met rien à jour
+            if not entries.filter(status='waiting').update(status='matched', matched_at=now):
+                return None  # Annulée ou déjà prise en charge ailleurs
+            # Noms affichés lus en une requête : Consultation.save() n'a pas à charger patient et médecin
+            names = dict(User.objects.filter(pk__in=[patient_id, doctor_id]).values_list('pk', 'username'))
+            consultation = Consultation(patient_id=patient_id, doctor_id=doctor_id, date=now)
+            consultation.set_display_names(names.get(patient_id, ''), names.get(doctor_id, ''), specialty)
+            consultation.save(using=self.using)
+            entries.update(consultation=consultation)
+        return consultation
+
+    def _pop(self, key):
+        with self._lock:
+            queue = self.queues[key]
+            if not queue:
+                return None
+            entry_id = queue.pop()
+            return entry_id, self.entries.pop(entry_id)
+
+    def next_patient(self, doctor_id, specialty):
+        """Attribue au médecin le prochain patient de sa spécialité ; retourne la consultation créée ou None."""
+        key = specialty_key(specialty)
+        self.sync()
+        with self._lock:
+            self.active_doctors[key][doctor_id] = time.monotonic()
+        while True:
+            # Entrée retirée de la file sous verrou, prise en charge en base hors verrou
+            popped = self._pop(key)
+            if popped is None:
+                return None
+            entry_id, item = popped
+            try:
+                consultation = self._claim(entry_id, item[2], doctor_id, specialty)
+            except Exception:
+                with self._lock:
+                    self._add(entry_id, *item)  # Échec en base : l'entrée reste dans la file
+                raise
+            if consultation is not None:
+                return consultation
+
+    def consultation_completed(self, consultation):
+        """Mesure la durée de la consultation terminée puis attribue au médecin le patient suivant."""
+        specialty = consultation.doctor_specialty or consultation.doctor.specialty
+        key = specialty_key(specialty)
+        elapsed = (timezone.now() - consultation.date).total_seconds()
+        if 0 < elapsed < MAX_SERVICE_TIME:
+            with self._lock:
+                previous = self.service_time.get(key, settings.WAITING_ROOM_SERVICE_MINUTES * 60)
+                self.service_time[key] = previous + SERVICE_TIME_WEIGHT * (elapsed - previous)
+        return self.next_patient(consultation.doctor_id, specialty)
+
+    def waiting_count(self, specialty):
+        self.sync()
+        return len(self.queues[specialty_key(specialty)])
+
+    def estimate(self, specialty, ahead):
+        """Attente estimée en secondes pour un patient ayant `ahead` patients devant lui."""
+        now = time.monotonic()
+        doctors = self.active_doctors[specialty]
+        for doctor_id, seen in list(doctors.items()):
+            if now - seen > ACTIVE_DOCTOR_WINDOW:
+                del doctors[doctor_id]
+        service = self.service_time.get(specialty, settings.WAITING_ROOM_SERVICE_MINUTES * 60)
+        return math.ceil((ahead + 1) / max(len(doctors), 1)) * service
+
+    def status(self, entry_id):
+        """(patients devant, attente estimée en secondes), ou None si l'entrée n'attend plus."""
+        self.sync()
+        if entry_id not in self.entries:
+            self.sync(force=True)  # Ajoutée par un autre worker depuis la dernière lecture
+        with self._lock:
+            item = self.entries.get(entry_id)
+            if item is None:
+                return None
+            specialty, priority, _ = item
+            ahead = self.queues[specialty].ahead(entry_id, priority)
+            return ahead, self.estimate(specialty, ahead)
+
+
+_rooms = {}
+_rooms_lock = threading.Lock()
+
+
+def get_waiting_room(using=None):
+    """Salle d'attente de la base `using` (par défaut : base de la région active)."""
+    using = using or router.db_for_write(WaitingRoomEntry)
+    room = _rooms.get(using)
+    if room is None:
+        with _rooms_lock:
+            room = _rooms.setdefault(using, WaitingRoom(using))
+    return room
+
+
+def reset_waiting_rooms():
+    """Oublie les files en mémoire : elles seront relues depuis la base (tests, reprise)."""
+    _rooms.clear()